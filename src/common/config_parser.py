@@ -38,7 +38,16 @@ import logging
 import json
 import configparser
 from pathlib import Path
-from typing import Iterable, Any, Optional, Callable, NamedTuple, TextIO, Tuple
+from typing import (
+    Iterable,
+    Any,
+    Optional,
+    Callable,
+    NamedTuple,
+    TextIO,
+    Tuple,
+    Mapping,
+)
 from types import MappingProxyType
 import re
 
@@ -343,7 +352,7 @@ class ConfigParser:
 
     def __init__(
         self,
-        schema: str | TextIO,
+        schema: str | TextIO | Mapping[str, Mapping[str, _SchemaEntry]],
         config: Optional[str | TextIO] = None,
         name: Optional[str] = None,
         gen_default: bool = True,
@@ -362,8 +371,9 @@ class ConfigParser:
         `load_and_check_config()`.
 
         Args:
-            schema (str | TextIO): Path to the schema file (.json) or an
-                already opened file-like object.
+            schema (str | TextIO | Mapping): Path to the schema file
+                (.json), an already opened file-like object or a schema
+                previously parsed with `parse_schema()`.
             config (str | TextIO | None): Path to the configuration file
                 (.ini), an already opened file-like object or leave empty
                 to only load the schema.
@@ -378,7 +388,6 @@ class ConfigParser:
             ConfigError: Any error related to data parsing, validation,
                 etc.
         """
-        self._schema: dict[str, dict[str, _SchemaEntry]] = {}
         self._config = configparser.ConfigParser(interpolation=None)
         self._data: dict[str, dict[str, Any]] = {}
 
@@ -393,7 +402,12 @@ class ConfigParser:
         else:
             self._name = name
 
-        self.__load_schema(schema)
+        # A parsed schema is never modified and can be shared
+        self._schema: Mapping[str, Mapping[str, _SchemaEntry]]
+        if isinstance(schema, Mapping):
+            self._schema = schema
+        else:
+            self._schema = self.parse_schema(schema, self._name)
 
         # Create a default configuration file if not existing
         if gen_default and isinstance(config, str) and not Path(config).exists():
@@ -412,14 +426,23 @@ class ConfigParser:
         if config:
             self.load_and_check_config(config)
 
-    def __load_schema(self, source: str | TextIO):
+    @classmethod
+    def parse_schema(
+        cls, source: str | TextIO, name: str = "schema"
+    ) -> dict[str, dict[str, _SchemaEntry]]:
         """
-        Load the schema file (.json). Populate `self._schema` data
-        structure.
+        Load and parse a schema file (.json). The result can be given to
+        several `ConfigParser` instances to avoid parsing the same
+        schema again.
 
         Args:
-            path (str | TextIO): Path to the schema file or an already
+            source (str | TextIO): Path to the schema file or an already
                 opened file-like object.
+            name (str): Name used to identify the schema in errors.
+
+        Returns:
+            dict[str, dict[str, _SchemaEntry]]: Schema entries by key
+                and section.
 
         Raises:
             ConfigError: Wrap any exception that may occur during json
@@ -433,23 +456,19 @@ class ConfigParser:
                 schema = json.load(source)
 
         except FileNotFoundError:
-            raise ConfigError(f"Schema file not found for '{self._name}'.")
+            raise ConfigError(f"Schema file not found for '{name}'.")
         except OSError as e:
-            raise ConfigError(f"OS error occurred opening '{self._name}'.") from e
+            raise ConfigError(f"OS error occurred opening '{name}'.") from e
         except json.JSONDecodeError as e:
-            raise ConfigError(
-                f"Schema parsing error occurred for '{self._name}'."
-            ) from e
+            raise ConfigError(f"Schema parsing error occurred for '{name}'.") from e
         except Exception as e:
-            raise ConfigError(f"Exception occurred for '{self._name}'.") from e
-
-        # Read the JSON data and populate the schema
-        for section in schema.keys():
-            self._schema[section] = {}
-            for key in schema[section].keys():
-                # Create a schema entry by key
-                entry = _SchemaEntry(key, schema[section][key])
-                self._schema[section][key] = entry
+            raise ConfigError(f"Exception occurred for '{name}'.") from e
+
+        # Read the JSON data and create a schema entry by key
+        return {
+            section: {key: _SchemaEntry(key, entry) for key, entry in keys.items()}
+            for section, keys in schema.items()
+        }
 
     def __load_config(self, source: str | TextIO):
         """
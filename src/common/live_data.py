@@ -11,7 +11,8 @@ Copyright (C) 2025 Mecacerf SA
 License: AGPL-3.0 <https://www.gnu.org/licenses/>
 """
 
-from typing import Generic, TypeVar, Callable
+from contextlib import contextmanager
+from typing import Any, Generic, Iterator, Optional, TypeVar, Callable
 
 T = TypeVar(name="T")  # Generic type declaration
 
@@ -40,9 +41,73 @@ class LiveData(Generic[T]):
         # Declare live data parameters
         self._value = value
         self._bus_mode = bus_mode
-        self._observers: set[Callable[[T], None]] = set()
+        # Observers with their optional predicate
+        self._observers: dict[Callable[[T], None], Optional[Callable[[T], bool]]] = {}
+        # Snapshot of the observers used for the notifications, rebuilt
+        # only when the observers change
+        self._dispatch: tuple[
+            tuple[Callable[[T], None], Optional[Callable[[T], bool]]], ...
+        ] = ()
+        # Batch state, see `LiveData.batch()`
+        self._batch_depth = 0
+        self._batch_origin: T = value
+        self._batch_dirty = False
+
+    @staticmethod
+    @contextmanager
+    def batch(*live_data: "LiveData[Any]") -> Iterator[None]:
+        """
+        Defer the notifications of the given live data until the end of
+        the context. Values set inside the context are immediately
+        readable, but observers are notified at most once per live data
+        on exit, with the last value set, in the order the live data are
+        given. No notification is sent if the value is back to what it
+        was when the context was entered. Batches can be nested.
+
+        Live data in bus mode are not batched: each value set is an
+        event and is notified immediately.
 
-    def observe(self, observer: Callable[[T], None], init_call: bool = False):
+        Args:
+            live_data (LiveData): Live data to batch.
+        """
+        for data in live_data:
+            data._begin_batch()
+        try:
+            yield
+        finally:
+            # Leave the batch for all the live data before notifying, an
+            # observer raising must not leave the others in the batch
+            to_notify = [data for data in live_data if data._end_batch()]
+            for data in to_notify:
+                data._notify()
+
+    def _begin_batch(self):
+        """Internal use only: enter a batch context."""
+        if self._batch_depth == 0:
+            self._batch_origin = self._value
+            self._batch_dirty = False
+        self._batch_depth += 1
+
+    def _end_batch(self) -> bool:
+        """
+        Internal use only: leave a batch context.
+
+        Returns:
+            bool: `True` if the observers must be notified.
+        """
+        self._batch_depth -= 1
+        if self._batch_depth > 0 or not self._batch_dirty:
+            return False
+
+        self._batch_dirty = False
+        return self._batch_origin != self._value
+
+    def observe(
+        self,
+        observer: Callable[[T], None],
+        init_call: bool = False,
+        predicate: Optional[Callable[[T], bool]] = None,
+    ):
         """
         Add an observer to the live data.
 
@@ -50,9 +115,12 @@ class LiveData(Generic[T]):
             observer (Callable[[T], None]): New observer to register.
             init_call (bool): `True` to setup the observer with the
                 current value.
+            predicate (Optional[Callable[[T], bool]]): Optional filter,
+                the observer is only called for values it accepts.
         """
-        self._observers.add(observer)
-        if init_call:
+        self._observers[observer] = predicate
+        self._dispatch = tuple(self._observers.items())
+        if init_call and (predicate is None or predicate(self._value)):
             observer(self._value)
 
     def remove(self, observer: Callable[[T], None]):
@@ -62,9 +130,16 @@ class LiveData(Generic[T]):
         Args:
             observer (Callable[[T], None]): Observer to remove.
         """
-        # Remove only if not present
-        if observer in self._observers:
-            self._observers.remove(observer)
+        # Remove only if present
+        self._observers.pop(observer, None)
+        self._dispatch = tuple(self._observers.items())
+
+    def remove_all(self):
+        """
+        Remove all the observers.
+        """
+        self._observers.clear()
+        self._dispatch = ()
 
     @property
     def value(self) -> T:
@@ -90,5 +165,18 @@ class LiveData(Generic[T]):
             return
 
         self._value = value
-        for observer in self._observers:
-            observer(self._value)
+        if self._batch_depth > 0 and not self._bus_mode:
+            # Notified at the end of the batch
+            self._batch_dirty = True
+            return
+
+        self._notify()
+
+    def _notify(self):
+        """
+        Call the observers with the current value.
+        """
+        value = self._value
+        for observer, predicate in self._dispatch:
+            if predicate is None or predicate(value):
+                observer(value)
@@ -65,6 +65,13 @@ import platform
 import socket
 
 
+def now() -> dt.datetime:
+    """
+    Get the current local time used to date the reports.
+    """
+    return dt.datetime.now()
+
+
 @dataclass
 class Report:
     """
@@ -98,7 +105,7 @@ class Report:
     sent_status: Event = field(init=False)
 
     def __post_init__(self):
-        self.created_at = dt.datetime.now()
+        self.created_at = now()
         self.device_id = config.section("general")["device"]
         self.machine_name = socket.gethostname()
         self.machine_os = (
@@ -25,6 +25,8 @@ class IStateBehavior(ABC):
     type of `fsm`.
     """
 
+    __slots__ = ("_fsm",)
+
     def _set_fsm(self, value: "IStateMachine"):
         """Internal use only: set the state machine reference"""
         self._fsm = value
@@ -18,7 +18,7 @@ from abc import ABC
 from enum import Enum
 import datetime as dt
 import time
-from typing import Sequence
+from typing import Callable, Sequence
 
 # Internal libraries
 from ..time_tracker import *
@@ -224,6 +224,7 @@ class AttendanceValidator(ABC):
         """
         start = time.time()
         date_errors: dict[dt.date, int] = {}
+        errors_cache: dict[int, AttendanceError] = {}
 
         # Retrieve and check the validation anchor date
         anchor_date = tracker.get_last_validation_anchor()
@@ -280,7 +281,7 @@ class AttendanceValidator(ABC):
             # highest error id in the read range
             dominant_id = max(date_errors.values(), default=0)
 
-        dominant = self.__to_error(tracker, dominant_id)
+        dominant = self.__to_error(tracker, dominant_id, errors_cache)
 
         logger.info(
             f"{tracker!s} Read existing errors "
@@ -303,7 +304,7 @@ class AttendanceValidator(ABC):
                 # Update the dominant error that may have increased after a scan
                 dominant_id = max(date_errors.values(), default=0)
                 dominant_id = max(dominant_id, dominant.error_id)
-                dominant = self.__to_error(tracker, dominant_id)
+                dominant = self.__to_error(tracker, dominant_id, errors_cache)
 
                 until_incl = until.date() - dt.timedelta(days=1)
                 scanned_days = (until.date() - anchor_date).days
@@ -327,7 +328,8 @@ class AttendanceValidator(ABC):
         # Save validation results
         self._dominant_error = dominant
         self._date_errors = {
-            edt: self.__to_error(tracker, eid) for edt, eid in date_errors.items()
+            edt: self.__to_error(tracker, eid, errors_cache)
+            for edt, eid in date_errors.items()
         }
 
         elapsed = (time.time() - start) * 1000
@@ -350,19 +352,32 @@ class AttendanceValidator(ABC):
 
         return dominant.status
 
-    def __to_error(self, tracker: TimeTracker, error_id: int) -> AttendanceError:
+    def __to_error(
+        self,
+        tracker: TimeTracker,
+        error_id: int,
+        cache: dict[int, AttendanceError],
+    ) -> AttendanceError:
         """
+        The description of an error identifier doesn't change during a
+        validation, so the errors objects are cached by identifier in
+        the given dictionary and shared between dates.
+
         Returns:
             AttendanceError: An attendance error object based on the
                 given error identifier.
         """
+        if error := cache.get(error_id):
+            return error
+
         desc = "unknown error"
         try:
             desc = tracker.get_attendance_error_desc(error_id)
         except TimeTrackerValueException:
             pass
 
-        return AttendanceError(error_id, desc)
+        error = cache[error_id] = AttendanceError(error_id, desc)
+        return error
 
     def _read_existing_errors(
         self,
@@ -430,48 +445,51 @@ class AttendanceValidator(ABC):
         """
         start = time.time()
 
-        # Reset the checkers to their initial state
+        # Reset the checkers to their initial state and bind their check
+        # methods once for the whole scan
+        checks: list[tuple[int, Callable[..., bool]]] = []
         for checker in self._checkers:
             checker.reset()
+            checks.append((checker.error_id, checker.check_date))
+
+        days = date_range.iter_days()
+        if not days:
+            # Nothing to scan and anchor doesn't move
+            logger.debug(f"{tracker!s} Validation range is empty. No scan performed.")
+            return None
 
-        new_anchor_date = None
-        errors: list[int] = []
-        for date in date_range.iter_days():
+        # Days in error in scan order, merged at the end of the scan
+        scanned: list[tuple[dt.date, int]] = []
+        for date in days:
             # Apply each checker on the date and get the highest error
             # returned
             date_evts = tracker.get_clocks(date)  # Called once before checks
             error = max(
-                [
-                    checker.error_id
-                    for checker in self._checkers
-                    if checker.check_date(tracker, date, date_evts)
-                ],
+                (
+                    error_id
+                    for error_id, check_date in checks
+                    if check_date(tracker, date, date_evts)
+                ),
                 default=0,
             )
 
             if error > 0:
-                # The validation anchor is moved to the first date in error
-                if new_anchor_date is None:
-                    new_anchor_date = date
-
-                # Write in the tracker and merge with existing errors
-                tracker.set_attendance_error(date, error)
-                date_errors[date] = max(date_errors.get(date, 0), error)
-                errors.append(error)
+                scanned.append((date, error))
 
-        if "date" not in locals():
-            # Iterable was empty -> nothing scanned and anchor didn't move
-            logger.debug(f"{tracker!s} Validation range is empty. No scan performed.")
-            return None
+        # Write in the tracker and merge with existing errors
+        tracker.set_attendance_errors(dict(scanned))
+        date_errors.update(
+            (date, max(date_errors.get(date, 0), error)) for date, error in scanned
+        )
 
-        # Move the validation anchor to the new anchor date if set, or to the
-        # next day to scan if no error found
-        new_anchor_date = new_anchor_date or date_range.rng_end
+        # Move the validation anchor to the first date in error if any, or to
+        # the next day to scan if no error found
+        new_anchor_date = scanned[0][0] if scanned else date_range.rng_end
 
         elapsed = (time.time() - start) * 1000
         logger.debug(
             f"{tracker!s} Scanned for errors in {elapsed:.0f} ms. "
-            f"Results: [{", ".join(str(err) for err in errors)}]."
+            f"Results: [{", ".join(str(err) for _, err in scanned)}]."
         )
 
         return new_anchor_date
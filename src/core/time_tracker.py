@@ -192,8 +192,13 @@ class DateRange:
             list[dt.date]: A list of all dates in the range `rng_start`
                 (inclusive) to `rng_end` (exclusive).
         """
-        one_day = dt.timedelta(days=1)
-        return [self.rng_start + one_day * i for i in range(self.days())]
+        # Step on the days ordinals rather than adding timedeltas
+        return list(
+            map(
+                dt.date.fromordinal,
+                range(self.rng_start.toordinal(), self.rng_end.toordinal()),
+            )
+        )
 
     def split_months(self) -> list["DateRange"]:
         """
@@ -709,6 +714,23 @@ class TimeTracker(Employee, ABC):
         """
         pass
 
+    def set_attendance_errors(self, errors: dict[dt.date, int]):
+        """
+        Set or reset the attendance errors of several dates at once.
+
+        The default implementation sets the errors one by one, a
+        tracker can override it to write the batch more efficiently.
+
+        Args:
+            errors (dict[dt.date, int]): The error ID to set by date, 0
+                for no error.
+
+        Raises:
+            See `set_attendance_error()`.
+        """
+        for date, error_id in errors.items():
+            self.set_attendance_error(date, error_id)
+
     @overload
     def get_attendance_error(self, date: dt.date) -> int: ...
     @overload
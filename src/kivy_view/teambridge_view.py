@@ -98,6 +98,48 @@ from typing import Optional, Any
 # Run method call interval in seconds
 RUN_INTERVAL = float(1.0 / 30.0)
 
+# Viewmodel states grouped by view behavior, looked up on each state change
+# States that wake up the screen
+ACTIVITY_STATES = frozenset(
+    {
+        "ClockActionState",
+        "ClockSuccessState",
+        "ConsultationActionState",
+        "ConsultationSuccessState",
+        "ShowAttendanceList",
+        "ErrorState",
+    }
+)
+# States for which the buttons are enabled
+ENABLED_STATES = frozenset(
+    {
+        "WaitClockActionState",
+        "WaitConsultationActionState",
+        "ConsultationSuccessState",
+    }
+)
+# Clock button is enabled in error state for acknowledgment as well
+CLOCK_ENABLED_STATES = ENABLED_STATES | {"ErrorState"}
+# States showing the progress bar loading animation
+LOADING_STATES = frozenset(
+    {
+        "ClockActionState",
+        "ClockSuccessState",
+        "ConsultationActionState",
+        "LoadAttendanceList",
+    }
+)
+# States showing the bottom panel expanded
+EXPANDED_STATES = frozenset({"ConsultationSuccessState", "ShowAttendanceList"})
+# Sound played when entering a state
+STATE_SOUNDS = {
+    "ClockActionState": SOUND_SCANNED,
+    "ConsultationActionState": SOUND_SCANNED,
+    "ShowAttendanceList": SOUND_SCANNED,
+    "ClockSuccessState": SOUND_CLOCKED,
+    "ErrorState": SOUND_ERROR,
+}
+
 
 class TeamBridgeApp(App):
     """
@@ -324,7 +366,14 @@ class MainScreen(FloatLayout):
             self._upd_reporting_service_sts, init_call=True
         )
         # Observe the viewmodel state
+        # Wakeup the screen and play sounds only for the concerned states
+        self._viewmodel.current_state.observe(
+            self._on_activity_state, predicate=ACTIVITY_STATES.__contains__
+        )
         self._viewmodel.current_state.observe(self._on_state_change)
+        self._viewmodel.current_state.observe(
+            self._play_state_sound, predicate=STATE_SOUNDS.__contains__
+        )
         # Update the UI style on theme change
         self._app.bind(theme=self._update_style)
 
@@ -363,29 +412,10 @@ class MainScreen(FloatLayout):
         """
         Update the state of view elements when the viewmodel state changes.
         """
-        # Call the application activity method to wakeup the screen
-        activity_states = [
-            "ClockActionState",
-            "ClockSuccessState",
-            "ConsultationActionState",
-            "ConsultationSuccessState",
-            "ShowAttendanceList",
-            "ErrorState",
-        ]
-        if state in activity_states:
-            self._app.on_screen_activity()
-
-        # Set the states for which the buttons are enabled
-        enabled_states = [
-            "WaitClockActionState",
-            "WaitConsultationActionState",
-            "ConsultationSuccessState",
-        ]
-        self.consultation_button.button_enabled = state in enabled_states
-        self.attendance_button.button_enabled = state in enabled_states
-        # Clock button is enabled in error state for acknowledgment as well
-        enabled_states.append("ErrorState")
-        self.clock_button.button_enabled = state in enabled_states
+        # Set the buttons enabled state
+        self.consultation_button.button_enabled = state in ENABLED_STATES
+        self.attendance_button.button_enabled = state in ENABLED_STATES
+        self.clock_button.button_enabled = state in CLOCK_ENABLED_STATES
 
         # Set the buttons toggle state
         self.clock_button.toggle_state = (
@@ -394,45 +424,38 @@ class MainScreen(FloatLayout):
         self.consultation_button.toggle_state = state == "WaitConsultationActionState"
 
         # Set the progress bar loading state
-        loading_states = [
-            "ClockActionState",
-            "ClockSuccessState",
-            "ConsultationActionState",
-            "LoadAttendanceList",
-        ]
-        self.progress_bar.loading = state in loading_states
+        self.progress_bar.loading = state in LOADING_STATES
 
         # Set the bottom panel expanded states
-        expanded_states = ["ConsultationSuccessState", "ShowAttendanceList"]
-        show_panel = state in expanded_states
+        show_panel = state in EXPANDED_STATES
         self.sliding_box_layout.expanded = show_panel
         # Show the collapse panel icon when the panel is expanded
         Animation(opacity=1.0 if show_panel else 0.0, duration=0.5).start(
             self.collapse_panel_icon  # type: ignore
         )
 
-        # Play sound depending on current state
-        state_sounds = {
-            "ClockActionState": SOUND_SCANNED,
-            "ConsultationActionState": SOUND_SCANNED,
-            "ShowAttendanceList": SOUND_SCANNED,
-            "ClockSuccessState": SOUND_CLOCKED,
-            "ErrorState": SOUND_ERROR,
-        }
-        # Check if state has an available sound
-        if state in state_sounds:
-            # Stop previous sound and play new one
-            if self._sound:
-                self._sound.stop()
-
-            self._sound = state_sounds[state]
-            if self._sound:
-                self._sound.volume = 1.0
-                self._sound.play()
-
         # Update UI elements style
         self._update_style()
 
+    def _on_activity_state(self, _: str):
+        """
+        Call the application activity method to wakeup the screen.
+        """
+        self._app.on_screen_activity()
+
+    def _play_state_sound(self, state: str):
+        """
+        Play the sound of a state that has one.
+        """
+        # Stop previous sound and play new one
+        if self._sound:
+            self._sound.stop()
+
+        self._sound = STATE_SOUNDS[state]
+        if self._sound:
+            self._sound.volume = 1.0
+            self._sound.play()
+
     def _update_style(self, *args: tuple[Any]):
         """
         Update the style of UI elements.
@@ -802,10 +825,11 @@ class TimeoutProgressBar(ProgressBar):
     def program_timeout(self, timeout: Optional[float]):
         """
         Args:
-            Optional[float]: time at which the bar will be full, if any.
+            Optional[float]: monotonic time at which the bar will be
+                full, if any.
         """
         if timeout:
-            duration = timeout - time.time()
+            duration = timeout - time.monotonic()
             self.value = 0.0
             self.opacity = 1.0
             self._anim = Animation(value=1.0, duration=duration, transition="linear")
@@ -51,6 +51,8 @@ class BarcodeScanner:
         self._scanning = threading.Event()
         # Pending codes set. These codes are waiting to be read
         self._pending_codes: set[str] = set()
+        # Flag set while the pending codes set is not empty
+        self._available = threading.Event()
         # Dictionary of codes that have been read and cannot be read again
         # before a timeout has expired
         self._cooldown_codes: dict[str, float] = {}
@@ -60,7 +62,7 @@ class BarcodeScanner:
 
     def configure(
         self,
-        regex: Optional[str] = None,
+        regex: Optional[str | re.Pattern[str]] = None,
         extract_group: Optional[int] = None,
         timeout: float = 0.0,
         debug_mode: bool = False,
@@ -73,8 +75,9 @@ class BarcodeScanner:
         camera environment.
 
         Args:
-            regex (str): Optional regular expression the scanned barcode
-                must match with.
+            regex (str | re.Pattern): Optional regular expression the
+                scanned barcode must match with, as a string or already
+                compiled.
             extract_group (int): When a regular expression is provided,
                 specify the group to extract the scanned ID from. If not
                 specified, the entire scan is used as ID.
@@ -82,7 +85,9 @@ class BarcodeScanner:
                 barcode ID.
             debug_mode (bool): Enable the debug mode.
         """
-        self._regex = regex
+        # Compile the expression once, it is matched on each scanned code.
+        # An already compiled pattern is returned as is.
+        self._regex = re.compile(regex) if regex else None
         self._extract_group = extract_group
         self._timeout = timeout
         self._debug_mode = debug_mode
@@ -191,7 +196,7 @@ class BarcodeScanner:
                 # A value has been scanned and decoded as a string
                 # Check if the decoded value matches the optional regex
                 if self._regex:
-                    matching = re.match(self._regex, value)
+                    matching = self._regex.match(value)
 
                     if matching:
                         if self._extract_group:
@@ -217,6 +222,7 @@ class BarcodeScanner:
                         # added in the pending list.
                         if value not in self._cooldown_codes:
                             self._pending_codes.add(value)
+                            self._available.set()
 
                 if self._debug_mode:
                     # Draw a rectangle around the scanned barcodes
@@ -311,8 +317,20 @@ class BarcodeScanner:
         Returns:
             bool: `True` if at least one code is available.
         """
-        with self._lock:
-            return bool(self._pending_codes)
+        return self._available.is_set()
+
+    def wait_available(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until a code has been scanned, or the timeout expires.
+
+        Args:
+            timeout (Optional[float]): Maximum time to wait in seconds,
+                `None` to wait indefinitely.
+
+        Returns:
+            bool: `True` if at least one code is available.
+        """
+        return self._available.wait(timeout)
 
     def read_next(self) -> str:
         """
@@ -334,6 +352,8 @@ class BarcodeScanner:
         """
         with self._lock:
             value = self._pending_codes.pop()
+            if not self._pending_codes:
+                self._available.clear()
             self._cooldown_codes[value] = time.time() + self._timeout
 
         return value
@@ -344,6 +364,7 @@ class BarcodeScanner:
         """
         with self._lock:
             self._pending_codes.clear()
+            self._available.clear()
             self._cooldown_codes.clear()
 
     def pause(self) -> None:
@@ -18,9 +18,11 @@ License: AGPL-3.0 <https://www.gnu.org/licenses/>
 import logging
 import datetime as dt
 import time
+import re
+from functools import cache, lru_cache
 from enum import Enum, auto
 from abc import ABC, abstractmethod
-from typing import cast
+from typing import Any, Callable, TypeVar, cast
 from os.path import join
 
 # Third-party libraries
@@ -45,6 +47,8 @@ _ui_conf = config.section("ui")
 
 SCANNER_CAMERA_IDX = _scanner_conf["camera_id"]
 SCANNER_RATE_HZ = _scanner_conf["scan_rate"]
+# Scanned IDs regular expression, compiled once for all scanner openings
+SCANNER_REGEX = re.compile(_scanner_conf["regex"]) if _scanner_conf["regex"] else None
 
 # Timeout for the attendance list task
 LOAD_ATTENDANCE_LIST_TIMEOUT = _ui_conf["load_attendance_list_timeout"]
@@ -57,9 +61,17 @@ SHOW_PRESENTATION_STATE_TIMEOUT = _ui_conf["show_consultation_timeout"]
 
 DEBUG_MODE = config.section("debug")["debug"]
 
+# Period in seconds between two reporting service status checks
+REPORTER_CHECK_PERIOD = 0.5
+
 # Font used for attendance list displaying
 ATTENDANCE_LIST_FONT = join("assets", "fonts", "Inter_28pt-Regular.ttf")
 
+# UI texts shared by several states
+TEXT_SHOW_BADGE = "Veuillez présenter votre badge"
+TEXT_ASK_SECRETARIAT = "Veuillez vous adresser au secrétariat"
+TEXT_UNAVAILABLE = "indisponible"
+
 
 class ViewModelAction(Enum):
     """
@@ -108,7 +120,14 @@ class TeamBridgeViewModel(IStateMachine):
         """
         # Enter the initial state
         # The entry() method is called at first run() call
-        super().__init__(_InitialState())
+        init_state = _InitialState()
+        super().__init__(init_state)
+
+        # Stateless states are created once per viewmodel and reused,
+        # see `_IViewModelState._reuse()`
+        self._stateless_states: dict[type[_IViewModelState], _IViewModelState] = {
+            _InitialState: init_state
+        }
 
         self._model = model
         self._scanner = scanner
@@ -124,7 +143,9 @@ class TeamBridgeViewModel(IStateMachine):
         self._panel_subtitle_text = LiveData[str]("")
         self._panel_content_text = LiveData[str]("")
         self._leave_time = LiveData[Optional[float]](None)
-        self._reporting_service = LiveData[bool](False)
+        # Without reporter, the status never changes
+        self._reporting_service = LiveData[bool](reporter is None)
+        self._next_reporter_check = 0.0
 
     @property
     def model(self) -> TeamBridgeScheduler:
@@ -142,10 +163,29 @@ class TeamBridgeViewModel(IStateMachine):
         """
         Run the state machine. Must be called at fixed interval.
         """
-        super().run()
-
-        # Update reporting service status
-        self._reporting_service.value = not self._reporter or self._reporter.available
+        # A state transition typically clears the texts on exit and
+        # sets them again on entry: notify the view only once per run,
+        # with the final values, whatever the scanning rate. The state
+        # is notified last, once the view has the texts of the new state
+        with LiveData.batch(
+            self._main_title_text,
+            self._main_subtitle_text,
+            self._panel_title_text,
+            self._panel_subtitle_text,
+            self._panel_content_text,
+            self._leave_time,
+            self._reporting_service,
+            self._current_state,
+        ):
+            super().run()
+
+            # Update reporting service status, the check is throttled
+            # since the status rarely changes
+            if self._reporter:
+                now = time.monotonic()
+                if now >= self._next_reporter_check:
+                    self._next_reporter_check = now + REPORTER_CHECK_PERIOD
+                    self._reporting_service.value = self._reporter.available
 
     def on_state_changed(
         self, old_state: Optional[IStateBehavior], new_state: IStateBehavior
@@ -153,12 +193,12 @@ class TeamBridgeViewModel(IStateMachine):
         """
         Called by the state machine on state change.
         """
-        logger.info(f"State changed from {old_state!r} to {self._state!r}.")
+        logger.info(f"State changed from {old_state!r} to {new_state!r}.")
 
         # The state machine must work with subclasses of _IViewModelState
-        assert isinstance(self._state, _IViewModelState)
+        assert isinstance(new_state, _IViewModelState)
 
-        self._current_state.value = repr(self._state)
+        self._current_state.value = repr(new_state)
 
     @property
     def next_action(self) -> ViewModelAction:
@@ -193,6 +233,20 @@ class TeamBridgeViewModel(IStateMachine):
         Close the viewmodel. It will automatically close the barcode scanner and the
         model in use.
         """
+        # Detach the observers first, the view may be destroyed while the
+        # scanner and the model are closing
+        for data in (
+            self._current_state,
+            self._main_title_text,
+            self._main_subtitle_text,
+            self._panel_title_text,
+            self._panel_subtitle_text,
+            self._panel_content_text,
+            self._leave_time,
+            self._reporting_service,
+        ):
+            data.remove_all()
+
         self._scanner.close(join=True)  # Close synchronously
         self._model.close()
 
@@ -255,8 +309,8 @@ class TeamBridgeViewModel(IStateMachine):
     def leave_time(self) -> LiveData[Optional[float]]:
         """
         Get the time at which the current state is programmed to leave
-        automatically. `None` is returned if the current state doesn't
-        time out.
+        automatically, as given by `time.monotonic()`. `None` is returned
+        if the current state doesn't time out.
 
         Returns:
             LiveData[Optional[float]]: Next state leave time.
@@ -272,19 +326,75 @@ class TeamBridgeViewModel(IStateMachine):
         return self._reporting_service
 
 
+_StateT = TypeVar("_StateT", bound="_IViewModelState")
+
+
 class _IViewModelState(IStateBehavior, ABC):
     """
     Define the base interface for a viewmodel state. Provide getters for
     the different UI information in the state.
     """
 
-    @property
-    def fsm(self) -> TeamBridgeViewModel:
-        return cast(TeamBridgeViewModel, self._fsm)
+    __slots__ = ("fsm",)
+
+    # Typed state machine reference, bound once when the state is
+    # attached instead of being cast on each access in the hot paths
+    fsm: TeamBridgeViewModel
+    # State name, set for each state class
+    _repr: str
+
+    def _set_fsm(self, value: IStateMachine):
+        super()._set_fsm(value)
+        self.fsm = cast(TeamBridgeViewModel, value)
+
+    def _reuse(self, state_cls: type[_StateT]) -> _StateT:
+        """
+        Get the instance of a stateless state for the state machine. The
+        instance is created at first call and reused for the next
+        transitions, so the state must reset its attributes in `entry()`
+        rather than in `__init__()`.
+
+        Args:
+            state_cls (type[_StateT]): Stateless state class.
+
+        Returns:
+            _StateT: Shared state instance.
+        """
+        states = self.fsm._stateless_states  # type: ignore friend class
+        state = states.get(state_cls)
+        if state is None:
+            state = states[state_cls] = state_cls()
+        return cast(_StateT, state)
+
+    # Next state factory by task result type, see `_result_state()`
+    RESULT_STATES: dict[type[IModelMessage], Callable[[Any], IStateBehavior]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        # State name is the class name without leading underscore
+        cls._repr = cls.__name__[1:]
+
+    def _result_state(self, msg: IModelMessage) -> IStateBehavior:
+        """
+        Get the state to enter once a task result is received, from the
+        state factory registered for its type in `RESULT_STATES`.
+
+        Args:
+            msg (IModelMessage): Task result.
+
+        Returns:
+            IStateBehavior: Next state.
+
+        Raises:
+            RuntimeError: The result type is unexpected in this state.
+        """
+        factory = self.RESULT_STATES.get(type(msg))
+        if factory is None:
+            raise RuntimeError(f"Unexpected message received {msg}")
+        return factory(msg)
 
     def __repr__(self):
-        # Return the class name and remove leading underscore
-        return self.__class__.__name__[1:]
+        return self._repr
 
 
 class _InitialState(_IViewModelState):
@@ -297,19 +407,24 @@ class _InitialState(_IViewModelState):
         - Once the barcode scanner is opened and scanning
     """
 
+    __slots__ = ("_next_retry",)
+
     # Delay in seconds between scanner opening retries
     RETRY_DELAY = 10.0
+    # Texts shown while the scanner is closed
+    MAIN_TITLE = "Hors service"
+    PANEL_TITLE = "Ouverture du scanner..."
 
     def entry(self):
         """
         Initial state entry: the barcode scanner is configured and
         opened.
         """
-        self.fsm.main_title_text.value = "Hors service"
-        self.fsm.panel_title_text.value = "Ouverture du scanner..."
+        self.fsm.main_title_text.value = self.MAIN_TITLE
+        self.fsm.panel_title_text.value = self.PANEL_TITLE
 
         self.fsm.scanner.configure(
-            regex=_scanner_conf["regex"],
+            regex=SCANNER_REGEX,
             extract_group=_scanner_conf["regex_group"],
             timeout=_scanner_conf["scanned_id_delay"],
             debug_mode=DEBUG_MODE,
@@ -332,7 +447,7 @@ class _InitialState(_IViewModelState):
                 exc_info=True,
             )
         finally:
-            self._next_retry = time.time() + self.RETRY_DELAY
+            self._next_retry = time.monotonic() + self.RETRY_DELAY
 
     def do(self) -> Optional[IStateBehavior]:
         """
@@ -341,9 +456,9 @@ class _InitialState(_IViewModelState):
         Stay in this state as long as the scanner is closed.
         """
         if self.fsm.scanner.is_scanning():
-            return _WaitClockActionState()
+            return self._reuse(_WaitClockActionState)
 
-        if time.time() > self._next_retry:
+        if time.monotonic() > self._next_retry:
             self.__open_scanner()
 
     def exit(self):
@@ -358,18 +473,21 @@ class _ScanningState(_IViewModelState, ABC):
         state must be specified by another state.
     """
 
+    __slots__ = ()
+
     def entry(self):
         # Scan until a barcode is found
         self.fsm.scanner.clear()  # Prevent staging barcode to show up
         self.fsm.scanner.resume()
 
     def do(self) -> Optional[IStateBehavior]:
-        if not self.fsm.scanner.is_scanning():
+        scanner = self.fsm.scanner
+        if not scanner.is_scanning():
             # Return to initial state, an error may have occurred
-            return _InitialState()
+            return self._reuse(_InitialState)
 
-        if self.fsm.scanner.available():
-            return self._next_state(self.fsm.scanner.read_next())
+        if scanner.available():
+            return self._next_state(scanner.read_next())
 
     @abstractmethod
     def _next_state(self, scanned_id: str) -> _IViewModelState:
@@ -395,19 +513,29 @@ class _WaitClockActionState(_ScanningState):
         - Once an id has been scanned
     """
 
+    __slots__ = ("_transitions",)
+
+    # Subtitle text naming the scanning mode
+    MAIN_SUBTITLE = "Mode de timbrage"
+
+    def __init__(self):
+        super().__init__()
+        # States to enter when the next action changes
+        self._transitions: dict[ViewModelAction, type[_IViewModelState]] = {
+            ViewModelAction.CONSULTATION: _WaitConsultationActionState,
+            ViewModelAction.ATTENDANCE_LIST: _LoadAttendanceList,
+        }
+
     def entry(self):
         super().entry()
 
-        self.fsm.main_title_text.value = "Veuillez présenter votre badge"
-        self.fsm.main_subtitle_text.value = "Mode de timbrage"
+        self.fsm.main_title_text.value = TEXT_SHOW_BADGE
+        self.fsm.main_subtitle_text.value = self.MAIN_SUBTITLE
         self.fsm.next_action = ViewModelAction.CLOCK_ACTION
 
     def do(self) -> Optional[IStateBehavior]:
-
-        if self.fsm.next_action == ViewModelAction.CONSULTATION:
-            return _WaitConsultationActionState()
-        if self.fsm.next_action == ViewModelAction.ATTENDANCE_LIST:
-            return _LoadAttendanceList()
+        if state_cls := self._transitions.get(self.fsm.next_action):
+            return self._reuse(state_cls)
 
         return super().do()
 
@@ -426,19 +554,29 @@ class _WaitConsultationActionState(_ScanningState):
         - Once an id has been scanned
     """
 
+    __slots__ = ("_transitions",)
+
+    # Subtitle text naming the scanning mode
+    MAIN_SUBTITLE = "Mode de consultation"
+
+    def __init__(self):
+        super().__init__()
+        # States to enter when the next action changes
+        self._transitions: dict[ViewModelAction, type[_IViewModelState]] = {
+            ViewModelAction.CLOCK_ACTION: _WaitClockActionState,
+            ViewModelAction.ATTENDANCE_LIST: _LoadAttendanceList,
+        }
+
     def entry(self):
         super().entry()
 
-        self.fsm.main_title_text.value = "Veuillez présenter votre badge"
-        self.fsm.main_subtitle_text.value = "Mode de consultation"
+        self.fsm.main_title_text.value = TEXT_SHOW_BADGE
+        self.fsm.main_subtitle_text.value = self.MAIN_SUBTITLE
         self.fsm.next_action = ViewModelAction.CONSULTATION
 
     def do(self) -> Optional[IStateBehavior]:
-
-        if self.fsm.next_action == ViewModelAction.CLOCK_ACTION:
-            return _WaitClockActionState()
-        if self.fsm.next_action == ViewModelAction.ATTENDANCE_LIST:
-            return _LoadAttendanceList()
+        if state_cls := self._transitions.get(self.fsm.next_action):
+            return self._reuse(state_cls)
 
         return super().do()
 
@@ -457,6 +595,13 @@ class _ClockActionState(_IViewModelState):
         - Once the clock in/out task is performed
     """
 
+    __slots__ = ("_id", "_handle")
+
+    RESULT_STATES = {
+        EmployeeEvent: lambda msg: _ClockSuccessState(msg),
+        ModelError: lambda msg: _ErrorState("Clock action task failed", msg),
+    }
+
     def __init__(self, id: str):
         super().__init__()
         self._id = id
@@ -471,12 +616,7 @@ class _ClockActionState(_IViewModelState):
     def do(self) -> Optional[IStateBehavior]:
         # Poll until the result is available
         if msg := self.fsm.model.get_result(self._handle):
-            if isinstance(msg, EmployeeEvent):
-                return _ClockSuccessState(msg)
-            elif isinstance(msg, ModelError):
-                return _ErrorState("Clock action task failed", msg)
-            else:
-                raise RuntimeError(f"Unexpected message received {msg}")
+            return self._result_state(msg)
 
     def exit(self):
         self.fsm.model.drop(self._handle)
@@ -493,6 +633,33 @@ class _ClockSuccessState(_IViewModelState):
         - When consultation data are available
     """
 
+    __slots__ = ("_evt", "_handle")
+
+    RESULT_STATES = {
+        # Always send an error report when coming from clocking mode
+        EmployeeData: lambda msg: _ConsultationSuccessState(
+            msg, timeout=SHOW_PRESENTATION_STATE_TIMEOUT, should_report=True
+        ),
+        ModelError: lambda msg: _ErrorState("Consultation task failed", msg),
+    }
+
+    # Main title text by clock action
+    TITLES = {
+        ClockAction.CLOCK_IN: "Entrée enregistrée",
+        ClockAction.CLOCK_OUT: "Sortie enregistrée",
+    }
+
+    # Greeting by clock action and hour of the day
+    GREETINGS = {
+        (action, hour): (
+            "Au revoir"
+            if action is ClockAction.CLOCK_OUT
+            else "Bonjour" if hour < 16 else "Bonsoir"
+        )
+        for action in ClockAction
+        for hour in range(24)
+    }
+
     def __init__(self, event: EmployeeEvent):
         super().__init__()
         self._evt = event
@@ -508,15 +675,7 @@ class _ClockSuccessState(_IViewModelState):
     def do(self) -> Optional[IStateBehavior]:
         # Move in presentation state as soon as the task is done
         if msg := self.fsm.model.get_result(self._handle):
-            if isinstance(msg, EmployeeData):
-                # Always send an error report when coming from clocking mode
-                return _ConsultationSuccessState(
-                    msg, timeout=SHOW_PRESENTATION_STATE_TIMEOUT, should_report=True
-                )
-            elif isinstance(msg, ModelError):
-                return _ErrorState("Consultation task failed", msg)
-            else:
-                raise RuntimeError(f"Unexpected message received {msg}")
+            return self._result_state(msg)
 
     def exit(self):
         self.fsm.model.drop(self._handle)
@@ -525,32 +684,13 @@ class _ClockSuccessState(_IViewModelState):
 
     def __main_title_text(self):
         # Format text according to event
-        text = ""
-        # Greetings
-        if self._evt.clock_evt.action == ClockAction.CLOCK_IN:
-            text = "Entrée "
-        else:
-            text = "Sortie "
-        # Clock action
-        text += "enregistrée"
-        # Return formatted text
-        return text
+        return self.TITLES[self._evt.clock_evt.action]
 
     def __main_subtitle_text(self):
-        # Format text according to event
-        text = ""
-        # Greetings
-        if self._evt.clock_evt.action == ClockAction.CLOCK_IN:
-            if self._evt.clock_evt.time.hour < 16:
-                text += "Bonjour"
-            else:
-                text += "Bonsoir"
-        else:
-            text += "Au revoir"
-        # Employee's firstname
-        text += f" {self._evt.firstname}"
-        # Return formatted text
-        return text
+        # Greetings followed by the employee's firstname
+        clock_evt = self._evt.clock_evt
+        greeting = self.GREETINGS[clock_evt.action, clock_evt.time.hour]
+        return f"{greeting} {self._evt.firstname}"
 
 
 class _ConsultationActionState(_IViewModelState):
@@ -563,6 +703,15 @@ class _ConsultationActionState(_IViewModelState):
         - When the consultation task is done
     """
 
+    __slots__ = ("_id", "_handle")
+
+    RESULT_STATES = {
+        EmployeeData: lambda msg: _ConsultationSuccessState(
+            msg, timeout=SHOW_PRESENTATION_STATE_TIMEOUT
+        ),
+        ModelError: lambda msg: _ErrorState("Consultation task failed", msg),
+    }
+
     def __init__(self, id: str):
         super().__init__()
         self._id = id
@@ -576,14 +725,7 @@ class _ConsultationActionState(_IViewModelState):
     def do(self) -> Optional[IStateBehavior]:
         # Move to presentation state as soon as the task is done
         if msg := self.fsm.model.get_result(self._handle):
-            if isinstance(msg, EmployeeData):
-                return _ConsultationSuccessState(
-                    msg, timeout=SHOW_PRESENTATION_STATE_TIMEOUT
-                )
-            elif isinstance(msg, ModelError):
-                return _ErrorState("Consultation task failed", msg)
-            else:
-                raise RuntimeError(f"Unexpected message received {msg}")
+            return self._result_state(msg)
 
     def exit(self):
         self.fsm.model.drop(self._handle)
@@ -602,6 +744,24 @@ class _ConsultationSuccessState(_ScanningState):
         - When the timeout is elapsed
     """
 
+    __slots__ = ("_data", "_timeout", "_should_report", "_leave")
+
+    # Invariant beginning of the error panel
+    ERROR_PANEL_HEADER = (
+        "Des erreurs empêchent l'affichage correct des informations. \n"
+        f"{TEXT_ASK_SECRETARIAT}.\n"
+        "\n"
+    )
+
+    # Fraction symbol and integer increment by quarter of day
+    DAY_FRACTIONS = (
+        ("", 0),  # No fraction
+        ("\u00bc", 0),  # ¼
+        ("\u00bd", 0),  # ½
+        ("\u00be", 0),  # ¾
+        ("", 1),  # Round up
+    )
+
     def __init__(
         self, data: EmployeeData, timeout: float = 15.0, should_report: bool = False
     ):
@@ -617,7 +777,7 @@ class _ConsultationSuccessState(_ScanningState):
         self.fsm.panel_content_text.value = self.__panel_content_text()
 
         # Program state leaving time
-        self._leave = time.time() + self._timeout
+        self._leave = time.monotonic() + self._timeout
         self.fsm.leave_time.value = self._leave
 
         # Send a warning / error report if configured for
@@ -637,7 +797,7 @@ class _ConsultationSuccessState(_ScanningState):
         if self._data.date_errors:
             body += "\n\nAll errors:\n"
             body += "\n".join(
-                [f"- {date}: {err}" for date, err in self._data.date_errors.items()]
+                f"- {date}: {err}" for date, err in self._data.date_errors.items()
             )
 
         # Report employee error
@@ -655,15 +815,16 @@ class _ConsultationSuccessState(_ScanningState):
 
     def do(self) -> Optional[IStateBehavior]:
         # Leave the state on reset signal
-        if self.fsm.next_action == ViewModelAction.RESET_TO_CLOCK_ACTION:
-            return _WaitClockActionState()
-        elif self.fsm.next_action == ViewModelAction.RESET_TO_CONSULTATION:
-            return _WaitConsultationActionState()
+        action = self.fsm.next_action
+        if action is ViewModelAction.RESET_TO_CLOCK_ACTION:
+            return self._reuse(_WaitClockActionState)
+        elif action is ViewModelAction.RESET_TO_CONSULTATION:
+            return self._reuse(_WaitConsultationActionState)
 
         # Leave the state when the timeout is elapsed
-        if time.time() > self._leave:
+        if time.monotonic() > self._leave:
             self.fsm.next_action = ViewModelAction.DEFAULT_ACTION
-            return _WaitClockActionState()
+            return self._reuse(_WaitClockActionState)
 
         return super().do()
 
@@ -680,95 +841,80 @@ class _ConsultationSuccessState(_ScanningState):
         return f"{self._data.firstname} {self._data.name}"
 
     def __panel_content_text(self):
-        data = self._data
-
-        if data.dominant_error.status == AttendanceErrorStatus.ERROR:
-            # Show the error panel
-            lines = [
-                "Des erreurs empêchent l'affichage correct des informations. ",
-                "Veuillez vous adresser au secrétariat.",
-                "",
-            ]
+        if self._data.dominant_error.status is AttendanceErrorStatus.ERROR:
+            return self.__error_panel_text(self._data)
+        return self.__info_panel_text(self._data)
 
-            # Keep only errors
-            errors = {
-                date: error
-                for date, error in data.date_errors.items()
-                if error.status is AttendanceErrorStatus.ERROR
-            }
+    def __error_panel_text(self, data: EmployeeData) -> str:
+        lines = [f"\u26a0 Erreur{"" if len(data.date_errors) == 1 else "s"}:"]
 
-            lines.append(f"\u26a0 Erreur{"" if len(data.date_errors) == 1 else "s"}:")
-            lines.extend(
-                [
-                    f"   \u2022 {self._fmt_date(date)}: {err.description}"
-                    for date, err in self._data.date_errors.items()
-                    if err.status is AttendanceErrorStatus.ERROR
-                ]
-            )
+        # Keep only errors
+        for date, err in data.date_errors.items():
+            if err.status is AttendanceErrorStatus.ERROR:
+                lines.append(f"   \u2022 {self._fmt_date(date)}: {err.description}")
+
+        # The dominant error may not be in the scanned range
+        if len(lines) == 1:
+            lines.append(f"   \u2022 date inconnue: {data.dominant_error.description}")
+
+        return self.ERROR_PANEL_HEADER + "\n".join(lines)
+
+    def __info_panel_text(self, data: EmployeeData) -> str:
+        # Extract and format
+        yty_bal = self._fmt_dt(
+            data.yty_balance, data.min_allowed_balance, data.max_allowed_balance
+        )
+        mty_bal = self._fmt_dt(data.month_to_yday_balance)
+        day_bal = self._fmt_dt(data.day_balance)
+        day_wtm = self._fmt_dt(data.day_worked_time)
+        day_stm = self._fmt_dt(data.day_schedule_time)
+        mth_vac = self._fmt_days(data.month_vacation)
+        rem_vac = self._fmt_days(data.remaining_vacation)
+
+        # Normal information panel
+        lines = [
+            f"\u2022 Présent: {'oui' if data.clocked_in else 'non'}",
+            f"\u2022 Balance totale au jour précédent: {yty_bal}",
+        ]
+
+        # Add a warning line if balance is out of range
+        if data.yty_balance:
+            # Clamp if not existing
+            min_bal = data.min_allowed_balance or data.yty_balance
+            max_bal = data.max_allowed_balance or data.yty_balance
+            if not min_bal <= data.yty_balance <= max_bal:
+                # Show allowed balance range only if both ends are configured
+                rng = ""
+                if data.min_allowed_balance and data.max_allowed_balance:
+                    rng = (
+                        f" ({self._fmt_dt(data.min_allowed_balance)} / "
+                        f"{self._fmt_dt(data.max_allowed_balance)})"
+                    )
 
-            # The dominant error may not be in the scanned range
-            if len(errors) == 0:
                 lines.append(
-                    f"   \u2022 date inconnue: {data.dominant_error.description}"
+                    f"   \u26a0 Hors de la plage autorisée{rng}, "
+                    "veuillez régulariser rapidement \u26a0"
                 )
-        else:
-            # Extract and format
-            yty_bal = self._fmt_dt(
-                data.yty_balance, data.min_allowed_balance, data.max_allowed_balance
-            )
-            mty_bal = self._fmt_dt(data.month_to_yday_balance)
-            day_bal = self._fmt_dt(data.day_balance)
-            day_wtm = self._fmt_dt(data.day_worked_time)
-            day_stm = self._fmt_dt(data.day_schedule_time)
-            mth_vac = self._fmt_days(data.month_vacation)
-            rem_vac = self._fmt_days(data.remaining_vacation)
-
-            # Normal information panel
-            lines = [
-                f"\u2022 Présent: {'oui' if data.clocked_in else 'non'}",
-                f"\u2022 Balance totale au jour précédent: {yty_bal}",
-            ]
 
-            # Add a warning line if balance is out of range
-            if data.yty_balance:
-                # Clamp if not existing
-                min_bal = data.min_allowed_balance or data.yty_balance
-                max_bal = data.max_allowed_balance or data.yty_balance
-                if not min_bal <= data.yty_balance <= max_bal:
-                    # Show allowed balance range only if both ends are configured
-                    rng = ""
-                    if data.min_allowed_balance and data.max_allowed_balance:
-                        rng = (
-                            f" ({self._fmt_dt(data.min_allowed_balance)} / "
-                            f"{self._fmt_dt(data.max_allowed_balance)})"
-                        )
-
-                    lines.append(
-                        f"   \u26a0 Hors de la plage autorisée{rng}, "
-                        "veuillez régulariser rapidement \u26a0"
-                    )
+        lines.extend(
+            [
+                f"\u2022 Balance du mois au jour précédent: {mty_bal}",
+                f"\u2022 Balance du jour: {day_bal} ({day_wtm} / {day_stm})",
+                f"\u2022 Vacances ce mois: {mth_vac}",
+                f"\u2022 Vacances à planifier: {rem_vac}",
+            ]
+        )
 
+        # Add errors if any
+        if data.date_errors:
+            lines.append(f"\u26a0 Problème{"" if len(data.date_errors) == 1 else "s"}:")
             lines.extend(
                 [
-                    f"\u2022 Balance du mois au jour précédent: {mty_bal}",
-                    f"\u2022 Balance du jour: {day_bal} ({day_wtm} / {day_stm})",
-                    f"\u2022 Vacances ce mois: {mth_vac}",
-                    f"\u2022 Vacances à planifier: {rem_vac}",
+                    f"   \u2022 {self._fmt_date(date)}: {err.description}"
+                    for date, err in data.date_errors.items()
                 ]
             )
 
-            # Add errors if any
-            if data.date_errors:
-                lines.append(
-                    f"\u26a0 Problème{"" if len(data.date_errors) == 1 else "s"}:"
-                )
-                lines.extend(
-                    [
-                        f"   \u2022 {self._fmt_date(date)}: {err.description}"
-                        for date, err in data.date_errors.items()
-                    ]
-                )
-
         return "\n".join(lines)
 
     def _fmt_dt(
@@ -778,7 +924,7 @@ class _ConsultationSuccessState(_ScanningState):
         td_max: Optional[dt.timedelta] = None,
     ):
         if td is None:
-            return "indisponible"
+            return TEXT_UNAVAILABLE
 
         # Check if a warning must be shown
         warn = ""
@@ -787,7 +933,8 @@ class _ConsultationSuccessState(_ScanningState):
         if td_max and td > td_max:
             warn = f" (\u26a0 max. {self._fmt_dt(td_max)} \u26a0)"
 
-        total_minutes = int(td.total_seconds() // 60)
+        # Whole minutes, rounded down, in integer arithmetic
+        total_minutes = td.days * 1440 + td.seconds // 60
         sign = "-" if total_minutes < 0 else ""
         abs_minutes = abs(total_minutes)
         hours, minutes = divmod(abs_minutes, 60)
@@ -799,7 +946,8 @@ class _ConsultationSuccessState(_ScanningState):
         return f"{sign}{hours}h{minutes:02}{warn}"
 
     def _fmt_date(self, date: dt.date):
-        return dt.date.strftime(date, "%d.%m.%Y")
+        # Same as strftime("%d.%m.%Y"), without the locale machinery
+        return f"{date.day:02}.{date.month:02}.{date.year}"
 
     def _fmt_days(self, days: Optional[float]) -> str:
         """
@@ -808,26 +956,15 @@ class _ConsultationSuccessState(_ScanningState):
         E.g., 1.26 → '1j ¼', 0.48 → '½j', 1.93 → '2j'
         """
         if days is None:
-            return "indisponible"
-
-        # Manual thresholds
-        thresholds = [
-            (0.875, "", 1),  # Round up
-            (0.625, "\u00be", 0),  # ¾
-            (0.375, "\u00bd", 0),  # ½
-            (0.125, "\u00bc", 0),  # ¼
-            (0.0, "", 0),  # No fraction
-        ]
+            return TEXT_UNAVAILABLE
 
         integer = int(days)
         decimal = days - integer
 
-        fraction_symbol = ""
-        for threshold, symbol, increment in thresholds:
-            if decimal >= threshold:
-                fraction_symbol = symbol
-                integer += increment
-                break
+        # Round the decimal part to the nearest quarter
+        quarter = max(0, int(decimal * 4 + 0.5))
+        fraction_symbol, increment = self.DAY_FRACTIONS[quarter]
+        integer += increment
 
         parts = []
         if integer > 0:
@@ -853,9 +990,11 @@ class _LoadAttendanceList(_IViewModelState):
         - When the timeout is elapsed
     """
 
+    __slots__ = ("_handle", "_timeout")
+
     def entry(self):
         self._handle = self.fsm.model.start_attendance_list_task(dt.datetime.now())
-        self._timeout = time.time() + LOAD_ATTENDANCE_LIST_TIMEOUT
+        self._timeout = time.monotonic() + LOAD_ATTENDANCE_LIST_TIMEOUT
 
     def do(self) -> Optional[IStateBehavior]:
         if self.fsm.model.available(self._handle):
@@ -865,7 +1004,7 @@ class _LoadAttendanceList(_IViewModelState):
                 return _ShowAttendanceList(result)
             return _ErrorState("No attendance list result received.")
 
-        if time.time() > self._timeout:
+        if time.monotonic() > self._timeout:
             return _ErrorState(
                 f"Timed out while loading attendance list "
                 f"(more than {LOAD_ATTENDANCE_LIST_TIMEOUT} sec elapsed)."
@@ -875,6 +1014,15 @@ class _LoadAttendanceList(_IViewModelState):
         self.fsm.model.drop(self._handle)
 
 
+@cache
+def _attendance_list_font() -> ImageFont.FreeTypeFont:
+    """
+    Load the attendance list font at first use and keep it for the
+    next attendance lists.
+    """
+    return ImageFont.truetype(ATTENDANCE_LIST_FONT, size=32)
+
+
 class _ShowAttendanceList(_IViewModelState):
     """
     Role:
@@ -886,58 +1034,74 @@ class _ShowAttendanceList(_IViewModelState):
         - When the timeout is elapsed
     """
 
+    __slots__ = ("_result", "_font", "_measure", "_space_width", "_timeout")
+
+    # Attendance list layout
+    MAX_COL_ENTRIES = 12
+    MAX_COL_NUMBER = 3
+    MAX_NAME_LENGTH = 45  # In terms of space units
+    COL_SPACING = 10
+    # Text shown when nobody is listed
+    EMPTY_LIST_TEXT = "Il n'y a personne."
+
     def __init__(self, result: AttendanceList):
         super().__init__()
         self._result = result
 
-        # Load attendance list font
-        self._font = ImageFont.truetype(ATTENDANCE_LIST_FONT, size=32)
+        # Attendance list font, loaded once
+        self._font = _attendance_list_font()
+        # Text measurements are memoized: the truncation measures many
+        # prefixes of the same names
+        self._measure = lru_cache(maxsize=4096)(self._font.getlength)
+        self._space_width = self._font.getlength(" ")
 
     def entry(self):
         self.fsm.panel_title_text.value = "Liste des présences"
         self.fsm.panel_content_text.value = self.__panel_content_text()
 
-        self._timeout = time.time() + SHOW_ATTENDANCE_LIST_TIMEOUT
+        self._timeout = time.monotonic() + SHOW_ATTENDANCE_LIST_TIMEOUT
         self.fsm.leave_time.value = self._timeout
 
         logger.info(f"Fetched attendance list in {self._result.fetch_time:.2f} sec.")
-        logger.info(
-            f"Present: {", ".join([f"{info.firstname} {info.name} ({info.id})" 
-            for info in self._result.present])}."
-        )
-        logger.info(
-            f"Absent: {", ".join([f"{info.firstname} {info.name} ({info.id})" 
-            for info in self._result.absent])}."
-        )
-        logger.info(
-            f"Unknown: {", ".join(f"{info.firstname} {info.name} ({info.id})" 
-            for info in self._result.unknown)}."
-        )
+        # Only format the employees lists if they are logged
+        if logger.isEnabledFor(logging.INFO):
+            for group, infos in (
+                ("Present", self._result.present),
+                ("Absent", self._result.absent),
+                ("Unknown", self._result.unknown),
+            ):
+                names = ", ".join(
+                    f"{info.firstname} {info.name} ({info.id})" for info in infos
+                )
+                logger.info(f"{group}: {names}.")
 
     def do(self) -> Optional[IStateBehavior]:
-        if self.fsm.next_action == ViewModelAction.RESET_TO_CLOCK_ACTION:
-            return _WaitClockActionState()
-        elif self.fsm.next_action == ViewModelAction.RESET_TO_CONSULTATION:
-            return _WaitConsultationActionState()
+        action = self.fsm.next_action
+        if action is ViewModelAction.RESET_TO_CLOCK_ACTION:
+            return self._reuse(_WaitClockActionState)
+        elif action is ViewModelAction.RESET_TO_CONSULTATION:
+            return self._reuse(_WaitConsultationActionState)
 
-        elif time.time() > self._timeout:
-            return _WaitClockActionState()
+        elif time.monotonic() > self._timeout:
+            return self._reuse(_WaitClockActionState)
 
     def exit(self):
         self.fsm.panel_title_text.value = ""
         self.fsm.panel_content_text.value = ""
         self.fsm.leave_time.value = None
 
+    # The layout methods below are string processing and are kept in
+    # plain Python on purpose: JIT compilers like Numba fall back to the
+    # slow object mode on such code and add a warm-up delay. Their cost
+    # is in the font measurements, which are memoized instead.
+
     def __panel_content_text(self):
         """
         Format the attendance list to be shown in the panel.
         """
-        from math import ceil
-
-        MAX_COL_ENTRIES = 12
-        MAX_COL_NUMBER = 3
-        MAX_NAME_LENGTH = 45  # In terms of space units
-        COL_SPACING = 10
+        # Nothing to lay out
+        if not self._result.present and not self._result.unknown:
+            return self.EMPTY_LIST_TEXT
 
         # Show the names of clocked-in employees as well as unknown ones, to
         # inform that an error occurred with this employee and the system doesn't
@@ -948,59 +1112,71 @@ class _ShowAttendanceList(_IViewModelState):
         ]
 
         # Truncate too long names
-        names = [self.__truncate(name, MAX_NAME_LENGTH) for name in names]
+        names = [self.__truncate(name, self.MAX_NAME_LENGTH) for name in names]
 
-        if len(names) == 0:
-            names = ["Il n'y a personne."]
-
-        max_names = MAX_COL_ENTRIES * MAX_COL_NUMBER
+        max_names = self.MAX_COL_ENTRIES * self.MAX_COL_NUMBER
         if len(names) > max_names:
             # Replace the last name to show the list continues
             names[max_names - 1] = f"+ {len(names) - max_names + 1} cachés..."
 
-        ncols = min(ceil(len(names) / MAX_COL_ENTRIES), MAX_COL_NUMBER)
+        # Integer ceiling division
+        ncols = min(-(-len(names) // self.MAX_COL_ENTRIES), self.MAX_COL_NUMBER)
+
+        # Measure the names once, for the column width and the padding
+        widths = [self.__text_width(name) for name in names]
+        cells = list(zip(names, widths))
 
         # Split names in columns of MAX_COL_SIZE
         columns = [
-            names[col * MAX_COL_ENTRIES : (col + 1) * MAX_COL_ENTRIES]
+            cells[col * self.MAX_COL_ENTRIES : (col + 1) * self.MAX_COL_ENTRIES]
             for col in range(ncols)
         ]
 
         # Pad last column with empty strings
-        columns[-1] += [""] * (MAX_COL_ENTRIES - len(columns[-1]))
+        columns[-1] += [("", 0.0)] * (self.MAX_COL_ENTRIES - len(columns[-1]))
 
         # Use longest name as the column width reference
-        col_width = max([self.__text_width(name) for name in names]) + COL_SPACING
+        col_width = max(widths) + self.COL_SPACING
+        # Longest padding, sliced for each cell
+        spaces = " " * round(col_width)
 
         # Print the names left justified
-        lines = []
-        for row in zip(*columns):
-            line = "".join([self.__ljust(name, col_width) for name in row])
-            lines.append(line)
-
-        return "\n".join(lines)
+        return "\n".join(
+            "".join(self.__ljust(name, width, col_width, spaces) for name, width in row)
+            for row in zip(*columns)
+        )
 
     def __text_width(self, text: str) -> float:
         """
         Returns the text width ratio related to the space character.
         """
-        return self._font.getlength(text) / self._font.getlength(" ")
+        return self._measure(text) / self._space_width
 
     def __truncate(self, text: str, width: float) -> str:
         """
         Truncate the text to specified width.
         """
-        for chars in range(1, len(text) + 1):
-            if self.__text_width(text[:chars]) > width:
-                # The text must be truncated
-                return text[: chars - 1] + "."
-        return text
+        if self.__text_width(text) <= width:
+            return text
+
+        # The text must be truncated: binary search the longest prefix
+        # that fits, the text width growing with its length
+        low, high = 0, len(text) - 1
+        while low < high:
+            mid = (low + high + 1) // 2
+            if self.__text_width(text[:mid]) > width:
+                high = mid - 1
+            else:
+                low = mid
+        return text[:low] + "."
 
-    def __ljust(self, text: str, width: float) -> str:
+    def __ljust(self, text: str, text_width: float, width: float, spaces: str) -> str:
         """
-        Left justify with spaces to reach given width.
+        Left justify with spaces to reach given width, the text being
+        already measured. The padding is sliced from the given spaces,
+        which must be long enough for an empty text.
         """
-        return text + (" " * max(0, round(width - self.__text_width(text))))
+        return text + spaces[: max(0, round(width - text_width))]
 
 
 class _ErrorState(_IViewModelState):
@@ -1013,6 +1189,8 @@ class _ErrorState(_IViewModelState):
         - Upon acknowledgment by sending the reset to clock action signal
     """
 
+    __slots__ = ("_message", "_error", "_report", "_timeout")
+
     def __init__(self, msg: str, error: Optional[ModelError] = None):
         super().__init__()
         self._message = msg
@@ -1022,7 +1200,7 @@ class _ErrorState(_IViewModelState):
 
     def entry(self):
         self.fsm.main_title_text.value = "Une erreur est survenue"
-        self.fsm.main_subtitle_text.value = "Veuillez vous adresser au secrétariat"
+        self.fsm.main_subtitle_text.value = TEXT_ASK_SECRETARIAT
 
         # Reset next action to prevent wrong acknowledgment
         self.fsm.next_action = ViewModelAction.DEFAULT_ACTION
@@ -1059,22 +1237,20 @@ class _ErrorState(_IViewModelState):
         if self.fsm.reporter is None:
             return
 
-        body = f"The application entered error state.\n\nError message: {self._message}"
-
-        if not self._error:
-            # Most simple error report
-            self._report = Report(ReportSeverity.ERROR, "Runtime exception", body)
-
-        elif not self._error.employee_id:
+        body = "The application entered error state.\n\nError message: " + self._message
+        if self._error:
             # Has error code and message
-            body += f"\nError code: {self._error.error_code}"
-            body += f"\nSpecific message: {self._error.message}"
+            body += (
+                f"\nError code: {self._error.error_code}"
+                f"\nSpecific message: {self._error.message}"
+            )
+
+        if not self._error or not self._error.employee_id:
+            # Application error report
             self._report = Report(ReportSeverity.ERROR, "Runtime exception", body)
 
         else:
             # Complete employee report
-            body += f"\nError code: {self._error.error_code}"
-            body += f"\nSpecific message: {self._error.message}"
             self._report = EmployeeReport(
                 ReportSeverity.ERROR,
                 "Employee runtime exception",
@@ -1088,18 +1264,18 @@ class _ErrorState(_IViewModelState):
 
     def do(self) -> Optional[IStateBehavior]:
         # Check if acknowledged
-        if self.fsm.next_action == ViewModelAction.RESET_TO_CLOCK_ACTION:
-            return _WaitClockActionState()
+        if self.fsm.next_action is ViewModelAction.RESET_TO_CLOCK_ACTION:
+            return self._reuse(_WaitClockActionState)
 
         if self._report and self._report.is_sent() and self._timeout is None:
             # Program the state timeout once a report has been sent
             # successfully
-            self._timeout = time.time() + SHOW_ERROR_STATE_TIMEOUT
+            self._timeout = time.monotonic() + SHOW_ERROR_STATE_TIMEOUT
             self.fsm.main_subtitle_text.value = "Veuillez réessayer ultérieurement"
             self.fsm.leave_time.value = self._timeout
 
-        if self._timeout and time.time() > self._timeout:
-            return _WaitClockActionState()
+        if self._timeout and time.monotonic() > self._timeout:
+            return self._reuse(_WaitClockActionState)
 
     def exit(self):
         self.fsm.main_title_text.value = ""
@@ -5,6 +5,7 @@ import pytest
 import datetime as dt
 
 # Internal libraries
+import common.reporter as reporter_module
 from common.reporter import (
     ReportSeverity,
     Report,
@@ -15,7 +16,11 @@ from common.reporter import (
 from bootstrap import LOGGING_FILE_NAME
 from local_config import LocalConfig
 
-config = LocalConfig()
+
+@pytest.fixture(scope="session")
+def config() -> LocalConfig:
+    return LocalConfig()
+
 
 ########################################################################
 #                    Reporting severity enum test                      #
@@ -36,24 +41,34 @@ def test_parse_unknown():
 ########################################################################
 
 
-def test_build_simple_report():
+@pytest.fixture
+def frozen_now(monkeypatch) -> dt.datetime:
+    """
+    Freeze the current time seen by the reporter module.
+    """
+    fixed = dt.datetime(2025, 1, 1, 12, 0, 0)
+    monkeypatch.setattr(reporter_module, "now", lambda: fixed)
+    return fixed
+
+
+def test_build_simple_report(config: LocalConfig, frozen_now: dt.datetime):
     report = Report(ReportSeverity.WARNING, "Test report", "Report content")
     report.attach_files(["example.png", "subprocess.log"])
 
     assert report.title == "Test report"
     assert report.severity == ReportSeverity.WARNING
     assert report.device_id == config.section("general")["device"]
-    assert dt.datetime.now() - report.created_at < dt.timedelta(minutes=1)
+    assert report.created_at == frozen_now
     assert report.content == "Report content"
     assert set(["example.png", "subprocess.log"]) == set(report.attachments)
     assert not report.is_sent()
 
 
-@pytest.fixture
-def tmp_log(tmp_path):
-    file = tmp_path / LOGGING_FILE_NAME
-    file.touch()  # create the empty file
-    yield tmp_path
+@pytest.fixture(scope="session")
+def tmp_log(tmp_path_factory):
+    folder = tmp_path_factory.mktemp("logs")
+    (folder / LOGGING_FILE_NAME).touch()  # create the empty file
+    return folder
 
 
 def test_build_report_attach_logs(tmp_log):
@@ -94,9 +109,13 @@ def mock_section(_):
     }
 
 
-def test_rules_severity(monkeypatch):
+@pytest.fixture
+def patch_section(monkeypatch):
     monkeypatch.setattr(reporter_config, "section", mock_section)
 
+
+@pytest.mark.usefixtures("patch_section")
+def test_rules_severity():
     with SimpleImpl() as reporter:
         report = Report(ReportSeverity.ERROR, "", None)
         assert reporter.check_rules(report)
@@ -104,9 +123,8 @@ def test_rules_severity(monkeypatch):
         assert not reporter.check_rules(report)
 
 
-def test_rules_error_id(monkeypatch):
-    monkeypatch.setattr(reporter_config, "section", mock_section)
-
+@pytest.mark.usefixtures("patch_section")
+def test_rules_error_id():
     with SimpleImpl() as reporter:
         report = EmployeeReport(ReportSeverity.ERROR, "", None, "666", error_id=100)
         assert reporter.check_rules(report)
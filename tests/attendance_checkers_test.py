@@ -2,13 +2,14 @@
 
 # Standard libraries
 import pytest
-from typing import Optional, cast
+from typing import Optional
 import datetime as dt
 import logging
 
 # Internal libraries
 from .test_constants import *
-from core.time_tracker import TimeTracker, ClockEvent, ClockAction
+from .classes_mocks import ClocksMockFactory
+from core.time_tracker import ClockEvent, ClockAction
 from core.attendance.simple_attendance_validator import (
     ContinuousWorkChecker,
     ClockSequenceChecker,
@@ -21,249 +22,227 @@ logger = logging.getLogger(__name__)
 ########################################################################
 
 
-class TimeTrackerMock:
+# Clock events shared by the test cases, events are immutable
+EVT_0000_IN = ClockEvent(dt.time(hour=0), ClockAction.CLOCK_IN)
+EVT_0800_IN = ClockEvent(dt.time(hour=8), ClockAction.CLOCK_IN)
+EVT_1032_OUT = ClockEvent(dt.time(hour=10, minute=32), ClockAction.CLOCK_OUT)
+EVT_1100_OUT = ClockEvent(dt.time(hour=11), ClockAction.CLOCK_OUT)
+EVT_1130_IN = ClockEvent(dt.time(hour=11, minute=30), ClockAction.CLOCK_IN)
+EVT_1730_OUT = ClockEvent(dt.time(hour=17, minute=30), ClockAction.CLOCK_OUT)
+EVT_2300_IN = ClockEvent(dt.time(hour=23), ClockAction.CLOCK_IN)
+EVT_2300_OUT = ClockEvent(dt.time(hour=23), ClockAction.CLOCK_OUT)
+MIDNIGHT_ROLLOVER = ClockEvent.midnight_rollover()
 
-    def __init__(self, evts: dict[dt.date, list[Optional[ClockEvent]]]):
-        self._evts = evts
 
-    def get_clocks(self, date: dt.date) -> list[Optional[ClockEvent]]:
-        return self._evts.get(date, [])
+@pytest.fixture(scope="module")
+def any_date():
+    return dt.date(2025, 5, 6)  # Anything except 31.12
 
-    @property
-    def max_continuous_work_time(self) -> dt.timedelta:
-        return dt.timedelta(hours=6)
 
+@pytest.fixture(scope="module")
+def continuous_work_checker() -> ContinuousWorkChecker:
+    return ContinuousWorkChecker()
 
-@pytest.fixture
-def any_date():
-    return dt.date(2025, 5, 6)  # Anything except 31.12
 
+@pytest.fixture(scope="module")
+def clock_sequence_checker() -> ClockSequenceChecker:
+    return ClockSequenceChecker()
 
-def test_continuous_work_checker_ok(any_date: dt.date):
+
+def check_days(
+    checker: ContinuousWorkChecker | ClockSequenceChecker,
+    mock_factory: ClocksMockFactory,
+    any_date: dt.date,
+    events: dict[int, list[Optional[ClockEvent]]],
+    expected: dict[int, bool],
+):
     """
-    Check that the error is not present after 5h59 of continuous work or
-    for an empty day.
+    Check the events placed relatively to the given date and compare
+    the results with the expected ones.
+
+    Args:
+        checker: The attendance checker to test.
+        mock_factory: Time tracker mock factory.
+        any_date (dt.date): Reference date.
+        events (dict[int, list[Optional[ClockEvent]]]): Clock events by
+            day offset from the reference date.
+        expected (dict[int, bool]): Expected check result by day offset
+            from the reference date.
     """
-    any_date_1 = any_date + dt.timedelta(days=1)
+    mock = mock_factory(
+        {any_date + dt.timedelta(days=day): evts for day, evts in events.items()}
+    )
+
+    for day, result in expected.items():
+        date = any_date + dt.timedelta(days=day)
+        assert checker.check_date(mock, date, mock.get_clocks(date)) == result
 
-    mock = cast(
-        TimeTracker,
-        TimeTrackerMock(
+
+@pytest.mark.parametrize(
+    "events, expected",
+    [
+        # The error is not present after 5h59 of continuous work or for an
+        # empty day
+        pytest.param(
             {
-                any_date: [
-                    ClockEvent(dt.time(hour=8), ClockAction.CLOCK_IN),
+                0: [
+                    EVT_0800_IN,
                     ClockEvent(dt.time(hour=13, minute=59), ClockAction.CLOCK_OUT),
                     None,
-                    ClockEvent(dt.time(hour=23), ClockAction.CLOCK_OUT),
+                    EVT_2300_OUT,
                 ]
-            }
+            },
+            {0: False, 1: False},
+            id="ok",
         ),
-    )
-
-    checker = ContinuousWorkChecker()
-    assert checker.error_id == ContinuousWorkChecker.ERROR_ID
-    assert not checker.check_date(mock, any_date, mock.get_clocks(any_date))
-    assert not checker.check_date(mock, any_date_1, mock.get_clocks(any_date_1))
-
-
-def test_continuous_work_checker_not_ok(any_date: dt.date):
-    """
-    Check that the error is present after 6h of continuous work.
-    """
-    mock = cast(
-        TimeTracker,
-        TimeTrackerMock(
+        # The error is present after 6h of continuous work
+        pytest.param(
             {
-                any_date: [
-                    ClockEvent(dt.time(hour=8), ClockAction.CLOCK_IN),
-                    ClockEvent(dt.time(hour=10, minute=32), ClockAction.CLOCK_OUT),
+                0: [
+                    EVT_0800_IN,
+                    EVT_1032_OUT,
                     None,
-                    ClockEvent(dt.time(hour=11), ClockAction.CLOCK_OUT),
-                    ClockEvent(dt.time(hour=11, minute=30), ClockAction.CLOCK_IN),
-                    ClockEvent(dt.time(hour=17, minute=30), ClockAction.CLOCK_OUT),
-                    ClockEvent(dt.time(hour=23), ClockAction.CLOCK_IN),
+                    EVT_1100_OUT,
+                    EVT_1130_IN,
+                    EVT_1730_OUT,
+                    EVT_2300_IN,
                 ]
-            }
+            },
+            {0: True},
+            id="not_ok",
         ),
-    )
-
-    checker = ContinuousWorkChecker()
-    assert checker.error_id == ContinuousWorkChecker.ERROR_ID
-    assert checker.check_date(mock, any_date, mock.get_clocks(any_date))
-
-
-def test_continuous_work_checker_not_ok_midnight(any_date: dt.date):
-    """
-    Check that the error is present after 6h of continuous work with a
-    midnight rollover. The error is reported the first day.
-    """
-    any_date_1 = any_date + dt.timedelta(days=1)
-
-    mock = cast(
-        TimeTracker,
-        TimeTrackerMock(
+        # The error is present after 6h of continuous work with a midnight
+        # rollover. The error is reported the first day.
+        pytest.param(
             {
-                any_date: [
+                0: [
                     ClockEvent(dt.time(hour=21), ClockAction.CLOCK_IN),
-                    ClockEvent.midnight_rollover(),
+                    MIDNIGHT_ROLLOVER,
                 ],
-                any_date_1: [
-                    ClockEvent(dt.time(hour=0), ClockAction.CLOCK_IN),
+                1: [
+                    EVT_0000_IN,
                     ClockEvent(dt.time(hour=3), ClockAction.CLOCK_OUT),
                 ],
-            }
+            },
+            {0: True, 1: False},
+            id="not_ok_midnight",
         ),
-    )
-
-    checker = ContinuousWorkChecker()
-    assert checker.error_id == ContinuousWorkChecker.ERROR_ID
-    assert checker.check_date(mock, any_date, mock.get_clocks(any_date))
-    assert not checker.check_date(mock, any_date_1, mock.get_clocks(any_date_1))
-
-
-def test_evts_order_ok(any_date: dt.date):
-    """
-    Check that the error is not present for an ordered dataset or an empty
-    dataset.
-    """
-    any_date_1 = any_date + dt.timedelta(days=1)
-
-    mock = cast(
-        TimeTracker,
-        TimeTrackerMock(
+    ],
+)
+def test_continuous_work_checker(
+    continuous_work_checker: ContinuousWorkChecker,
+    clocks_mock_factory: ClocksMockFactory,
+    any_date: dt.date,
+    events: dict[int, list[Optional[ClockEvent]]],
+    expected: dict[int, bool],
+):
+    """
+    Check the continuous work time error detection.
+    """
+    assert continuous_work_checker.error_id == ContinuousWorkChecker.ERROR_ID
+    check_days(continuous_work_checker, clocks_mock_factory, any_date, events, expected)
+
+
+@pytest.mark.parametrize(
+    "events, expected",
+    [
+        # The error is not present for an ordered dataset or an empty
+        # dataset
+        pytest.param(
             {
-                any_date: [
-                    ClockEvent(dt.time(hour=8), ClockAction.CLOCK_IN),
-                    ClockEvent(dt.time(hour=10, minute=32), ClockAction.CLOCK_OUT),
+                0: [
+                    EVT_0800_IN,
+                    EVT_1032_OUT,
                     None,
-                    ClockEvent(dt.time(hour=11), ClockAction.CLOCK_OUT),
-                    ClockEvent(dt.time(hour=11, minute=30), ClockAction.CLOCK_IN),
-                    ClockEvent(dt.time(hour=17, minute=30), ClockAction.CLOCK_OUT),
-                    ClockEvent(dt.time(hour=23), ClockAction.CLOCK_IN),
+                    EVT_1100_OUT,
+                    EVT_1130_IN,
+                    EVT_1730_OUT,
+                    EVT_2300_IN,
                     ClockEvent(dt.time(hour=23, minute=1), ClockAction.CLOCK_OUT),
                 ]
-            }
+            },
+            {0: False, 1: False},
+            id="ok",
         ),
-    )
-
-    checker = ClockSequenceChecker()
-    assert checker.error_id == ClockSequenceChecker.ERROR_ID
-    assert not checker.check_date(mock, any_date, mock.get_clocks(any_date))
-    assert not checker.check_date(mock, any_date_1, mock.get_clocks(any_date_1))
-
-
-def test_evts_order_ok_midnight(any_date: dt.date):
-    """
-    Check that the error is not present for an ordered dataset with
-    midnight rollover.
-    """
-    mock = cast(
-        TimeTracker,
-        TimeTrackerMock(
+        # The error is not present for an ordered dataset with midnight
+        # rollover
+        pytest.param(
             {
-                any_date: [
-                    ClockEvent(dt.time(hour=8), ClockAction.CLOCK_IN),
-                    ClockEvent(dt.time(hour=10, minute=32), ClockAction.CLOCK_OUT),
+                0: [
+                    EVT_0800_IN,
+                    EVT_1032_OUT,
                     None,
-                    ClockEvent(dt.time(hour=11), ClockAction.CLOCK_OUT),
-                    ClockEvent(dt.time(hour=11, minute=30), ClockAction.CLOCK_IN),
-                    ClockEvent(dt.time(hour=17, minute=30), ClockAction.CLOCK_OUT),
-                    ClockEvent(dt.time(hour=23), ClockAction.CLOCK_IN),
-                    ClockEvent.midnight_rollover(),  # Trigger a check the next day
+                    EVT_1100_OUT,
+                    EVT_1130_IN,
+                    EVT_1730_OUT,
+                    EVT_2300_IN,
+                    MIDNIGHT_ROLLOVER,  # Trigger a check the next day
                 ],
-                any_date
-                + dt.timedelta(days=1): [
-                    ClockEvent(dt.time(hour=0), ClockAction.CLOCK_IN),
+                1: [
+                    EVT_0000_IN,
                     ClockEvent(dt.time(hour=5), ClockAction.CLOCK_OUT),
                 ],
-            }
+            },
+            {0: False},
+            id="ok_midnight",
         ),
-    )
-
-    checker = ClockSequenceChecker()
-    assert checker.error_id == ClockSequenceChecker.ERROR_ID
-    assert not checker.check_date(mock, any_date, mock.get_clocks(any_date))
-
-
-def test_evts_order_not_ok(any_date: dt.date):
-    """
-    Check that the error is present for an unordered dataset.
-    """
-    mock = cast(
-        TimeTracker,
-        TimeTrackerMock(
+        # The error is present for an unordered dataset
+        pytest.param(
             {
-                any_date: [
-                    ClockEvent(dt.time(hour=8), ClockAction.CLOCK_IN),
-                    ClockEvent(dt.time(hour=10, minute=32), ClockAction.CLOCK_OUT),
+                0: [
+                    EVT_0800_IN,
+                    EVT_1032_OUT,
                     None,
-                    ClockEvent(dt.time(hour=11), ClockAction.CLOCK_OUT),
-                    ClockEvent(dt.time(hour=11, minute=30), ClockAction.CLOCK_IN),
-                    ClockEvent(dt.time(hour=17, minute=30), ClockAction.CLOCK_OUT),
-                    ClockEvent(dt.time(hour=23), ClockAction.CLOCK_IN),
-                    ClockEvent(dt.time(hour=23), ClockAction.CLOCK_OUT),  # Same time
+                    EVT_1100_OUT,
+                    EVT_1130_IN,
+                    EVT_1730_OUT,
+                    EVT_2300_IN,
+                    EVT_2300_OUT,  # Same time
                 ]
-            }
+            },
+            {0: True},
+            id="not_ok",
         ),
-    )
-
-    checker = ClockSequenceChecker()
-    assert checker.error_id == ClockSequenceChecker.ERROR_ID
-    assert checker.check_date(mock, any_date, mock.get_clocks(any_date))
-
-
-def test_evts_order_not_ok_midnight(any_date: dt.date):
-    """
-    Check that the error is present for a dataset with a midnight rollover
-    that is not followed by a clock-in at midnight.
-    """
-    any_date_1 = any_date + dt.timedelta(days=1)
-
-    mock = cast(
-        TimeTracker,
-        TimeTrackerMock(
+        # The error is present for a dataset with a midnight rollover that
+        # is not followed by a clock-in at midnight. The error is reported
+        # the first day.
+        pytest.param(
             {
-                any_date: [
-                    ClockEvent(dt.time(hour=8), ClockAction.CLOCK_IN),
-                    ClockEvent.midnight_rollover(),  # Trigger a check the next day
+                0: [
+                    EVT_0800_IN,
+                    MIDNIGHT_ROLLOVER,  # Trigger a check the next day
                 ],
-                any_date_1: [
+                1: [
                     # Should start with a clock-in at 00:00
                     ClockEvent(dt.time(hour=0, minute=1), ClockAction.CLOCK_IN),
                 ],
-            }
+            },
+            {0: True, 1: False},
+            id="not_ok_midnight",
         ),
-    )
-
-    checker = ClockSequenceChecker()
-    assert checker.error_id == ClockSequenceChecker.ERROR_ID
-    # The error is reported the first day
-    assert checker.check_date(mock, any_date, mock.get_clocks(any_date))
-    assert not checker.check_date(mock, any_date_1, mock.get_clocks(any_date_1))
-
-
-def test_evts_order_not_ok_midnight_missing(any_date: dt.date):
-    """
-    Check that the error is present for a dataset with a midnight rollover
-    that is not followed by a clock-in at midnight (missing event).
-    """
-    any_date_1 = any_date + dt.timedelta(days=1)
-
-    mock = cast(
-        TimeTracker,
-        TimeTrackerMock(
+        # Same with a missing event: we assume the HR forgot to fill the
+        # next day
+        pytest.param(
             {
-                any_date: [
-                    ClockEvent(dt.time(hour=8), ClockAction.CLOCK_IN),
-                    ClockEvent.midnight_rollover(),  # Trigger a check the next day
+                0: [
+                    EVT_0800_IN,
+                    MIDNIGHT_ROLLOVER,  # Trigger a check the next day
                 ]
-                # We assume the HR forgot to fill the next day
-            }
+            },
+            {0: True, 1: False},
+            id="not_ok_midnight_missing",
         ),
-    )
-
-    checker = ClockSequenceChecker()
-    assert checker.error_id == ClockSequenceChecker.ERROR_ID
-    # The error is reported the first day
-    assert checker.check_date(mock, any_date, mock.get_clocks(any_date))
-    assert not checker.check_date(mock, any_date_1, mock.get_clocks(any_date_1))
+    ],
+)
+def test_evts_order(
+    clock_sequence_checker: ClockSequenceChecker,
+    clocks_mock_factory: ClocksMockFactory,
+    any_date: dt.date,
+    events: dict[int, list[Optional[ClockEvent]]],
+    expected: dict[int, bool],
+):
+    """
+    Check the clock events sequence error detection.
+    """
+    assert clock_sequence_checker.error_id == ClockSequenceChecker.ERROR_ID
+    check_days(clock_sequence_checker, clocks_mock_factory, any_date, events, expected)
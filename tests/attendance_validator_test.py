@@ -2,9 +2,12 @@
 
 # Standard libraries
 import pytest
-from typing import Optional, cast, Callable
+from typing import Any, Mapping, Optional, Callable
 import datetime as dt
 import logging
+from functools import cache
+from bisect import bisect_left
+from types import MappingProxyType
 
 # Internal libraries
 from .test_constants import *
@@ -54,6 +57,23 @@ class CustomChecker(AttendanceChecker):
         return self._func(tracker, date, evts)
 
 
+def days_multiple_of(
+    n: int,
+) -> Callable[[TimeTracker, dt.date, list[Optional[ClockEvent]]], bool]:
+    """
+    Get a checker function that reports an error on the days of the month
+    that are a multiple of `n`.
+    """
+
+    # Bit mask of the matching days of the month
+    mask = sum(1 << day for day in range(n, 32, n))
+
+    def check(_: TimeTracker, date: dt.date, __: list[Optional[ClockEvent]]) -> bool:
+        return bool(mask >> date.day & 1)
+
+    return check
+
+
 class TimeTrackerMock:
 
     def __init__(
@@ -61,33 +81,45 @@ class TimeTrackerMock:
         year: int,
         anchor: Optional[dt.date] = None,
         clk_evts: Optional[list[Optional[ClockEvent]]] = None,
-        app_errors: Optional[dict[dt.date, int]] = None,
-        tracker_errors: Optional[dict[dt.date, int]] = None,
+        app_errors: Optional[Mapping[dt.date, int]] = None,
+        tracker_errors: Optional[Mapping[dt.date, int]] = None,
         year_error: Optional[int] = None,
     ):
         self._year = year
 
-        self.anchor = dt.datetime.now().date()
-        if anchor:
-            self.anchor = anchor
-
-        self._clk_evts = []
-        if clk_evts:
-            self._clk_evts = clk_evts
-
-        self._errors = {}
-        if app_errors:
-            self._app_errors = app_errors
-
-        self._tracker_errors = {}
-        if tracker_errors:
-            self._tracker_errors = tracker_errors
-
-        self._year_error = 0
-        if year_error:
-            self._year_error = year_error
-
-        self.set_errors = {}
+        self.anchor = anchor if anchor is not None else dt.date.today()
+        self._clk_evts = clk_evts or []
+
+        # Errors keyed by the dates ordinals
+        self._app_errors = {d.toordinal(): e for d, e in (app_errors or {}).items()}
+        self._tracker_errors = {
+            d.toordinal(): e for d, e in (tracker_errors or {}).items()
+        }
+
+        self._year_error = year_error or 0
+
+        # Errors ordinals in order, to look up the ranges by bisection
+        self._app_days = sorted(self._app_errors)
+        self._tracker_days = sorted(self._tracker_errors)
+
+        # Errors written by the validator, in order
+        self._set_errors: list[tuple[dt.date, int]] = []
+
+    @staticmethod
+    def _range_errors(
+        errors: dict[int, int], days: list[int], rng: DateRange
+    ) -> dict[dt.date, int]:
+        """
+        Get an entry for every day in the range, the days without error
+        are set to 0.
+        """
+        start = bisect_left(days, rng.rng_start.toordinal())
+        end = bisect_left(days, rng.rng_end.toordinal(), lo=start)
+        range_errors = dict.fromkeys(rng.iter_days(), 0)
+        range_errors.update(
+            (dt.date.fromordinal(day), errors[day]) for day in days[start:end]
+        )
+        return range_errors
 
     def __str__(self):
         return f"{self.__class__.__name__}"
@@ -97,7 +129,7 @@ class TimeTrackerMock:
         return self._year
 
     def analyze(self, datetime: dt.datetime):
-        logger.info(f"{self!s} analyzed for {datetime}.")
+        logger.info("%s analyzed for %s.", self, datetime)
 
     @property
     def analyzed(self):
@@ -107,52 +139,95 @@ class TimeTrackerMock:
         return self._clk_evts
 
     def save(self):
-        logger.info(f"{self!s} saved.")
+        logger.info("%s saved.", self)
 
     def get_last_validation_anchor(self) -> dt.date:
         return self.anchor
 
     def get_attendance_error(self, date: DateOrDateRange) -> IntOrPerDate:
         if isinstance(date, dt.date):
-            return self._app_errors.get(date, 0)
-        return {date: self._app_errors.get(date, 0) for date in date.iter_days()}
+            return self._app_errors.get(date.toordinal(), 0)
+        return self._range_errors(self._app_errors, self._app_days, date)
 
-    def get_attendance_error_desc(self, error_id: int) -> str:
+    @staticmethod
+    def get_attendance_error_desc(error_id: int) -> str:
         return f"Mock error {error_id}"
 
     def read_day_attendance_error(self, date: DateOrDateRange) -> IntOrPerDate:
         if isinstance(date, dt.date):
-            return self._tracker_errors.get(date, 0)
-        return {date: self._tracker_errors.get(date, 0) for date in date.iter_days()}
+            return self._tracker_errors.get(date.toordinal(), 0)
+        return self._range_errors(self._tracker_errors, self._tracker_days, date)
 
     def read_year_attendance_error(self) -> int:
         return self._year_error
 
     def set_attendance_error(self, date: dt.date, error_id: int):
-        self.set_errors[date] = error_id
+        self._set_errors.append((date, error_id))
+
+    def set_attendance_errors(self, errors: dict[dt.date, int]):
+        self._set_errors.extend(errors.items())
+
+    @property
+    def set_errors(self) -> dict[dt.date, int]:
+        return dict(self._set_errors)
 
     def set_last_validation_anchor(self, date: dt.date):
         self.anchor = date
 
 
-def test_existing_errors_simple_tracker():
+class TimeTrackerAnalyzerMock(TimeTrackerMock):
+    pass
+
+
+@pytest.fixture(scope="session", autouse=True)
+def register_analyzer_mock():
+    """
+    Make the analyzer mock class virtually extend `TimeTrackerAnalyzer`,
+    once for the session. ABCs can't unregister a class, so there is no
+    teardown.
+    """
+    TimeTrackerAnalyzer.register(TimeTrackerAnalyzerMock)
+
+
+@cache
+def to_error(error_id: int) -> AttendanceError:
+    """
+    Get the attendance error described by the mock for the given ID. The
+    errors are only compared, so the same instance is shared.
+    """
+    return AttendanceError(
+        error_id, TimeTrackerMock.get_attendance_error_desc(error_id)
+    )
+
+
+@pytest.fixture
+def make_mock() -> Callable[..., TimeTracker]:
+    """
+    Get a factory of time tracker mocks for the year 2025. The mock
+    extends `TimeTrackerAnalyzer` when created with `analyzer=True`.
+    """
+
+    def make(analyzer: bool = False, **kwargs: Any) -> TimeTracker:
+        mock_cls = TimeTrackerAnalyzerMock if analyzer else TimeTrackerMock
+        return mock_cls(2025, **kwargs)  # type: ignore[return-value]
+
+    return make
+
+
+def test_existing_errors_simple_tracker(make_mock: Callable[..., TimeTracker]):
     """
     Test the private `_read_existing_errors` of the validator. It should
     return the application errors contained in the given range.
     """
     dates_rng = DateRange(dt.date(2025, 1, 1), dt.date(2025, 2, 10))
 
-    mock = cast(
-        TimeTracker,
-        TimeTrackerMock(
-            2025,
-            app_errors={
-                dt.date(2025, 1, 2): 10,
-                dt.date(2025, 2, 5): 10,
-                dt.date(2025, 1, 20): 20,
-                dt.date(2025, 2, 26): 20,  # Out of range
-            },
-        ),
+    mock = make_mock(
+        app_errors={
+            dt.date(2025, 1, 2): 10,
+            dt.date(2025, 2, 5): 10,
+            dt.date(2025, 1, 20): 20,
+            dt.date(2025, 2, 26): 20,  # Out of range
+        },
     )
 
     expected_errors = {
@@ -168,38 +243,28 @@ def test_existing_errors_simple_tracker():
     assert date_errors == expected_errors
 
 
-def test_existing_errors_tracker_analyzer():
+def test_existing_errors_tracker_analyzer(make_mock: Callable[..., TimeTracker]):
     """
     Test the private `_read_existing_errors` of the validator. It should
     return the merge of the application errors and the time tracker
     analyzer errors, with the highest error selected for each day.
     """
-
-    # Make a mock class that virtually extends TimeTrackerAnalyzer
-    class TimeTrackerAnalyzerMock(TimeTrackerMock):
-        pass
-
-    TimeTrackerAnalyzer.register(TimeTrackerAnalyzerMock)
-
     dates_rng = DateRange(dt.date(2025, 1, 2), dt.date(2025, 2, 10))
 
-    mock = cast(
-        TimeTrackerAnalyzer,
-        TimeTrackerAnalyzerMock(
-            2025,
-            app_errors={
-                dt.date(2025, 1, 1): 10,  # Out of range
-                dt.date(2025, 1, 2): 10,
-                dt.date(2025, 2, 5): 10,
-                dt.date(2025, 1, 20): 20,
-            },
-            tracker_errors={
-                dt.date(2025, 1, 12): 40,
-                dt.date(2025, 1, 20): 30,
-                dt.date(2025, 2, 20): 30,  # Out of range
-            },
-            year_error=40,  # The analyzer provides the highest error
-        ),
+    mock = make_mock(
+        analyzer=True,
+        app_errors={
+            dt.date(2025, 1, 1): 10,  # Out of range
+            dt.date(2025, 1, 2): 10,
+            dt.date(2025, 2, 5): 10,
+            dt.date(2025, 1, 20): 20,
+        },
+        tracker_errors={
+            dt.date(2025, 1, 12): 40,
+            dt.date(2025, 1, 20): 30,
+            dt.date(2025, 2, 20): 30,  # Out of range
+        },
+        year_error=40,  # The analyzer provides the highest error
     )
 
     expected_errors = {
@@ -216,35 +281,25 @@ def test_existing_errors_tracker_analyzer():
     assert date_errors == expected_errors
 
 
-def test_existing_errors_tracker_analyzer_abort():
+def test_existing_errors_tracker_analyzer_abort(make_mock: Callable[..., TimeTracker]):
     """
     Test the private `_read_existing_errors` of the validator. It should
     abort the read process if the analyzer says that the year error (most
     critical error registered) is 0.
     """
-
-    # Make a mock class that virtually extends TimeTrackerAnalyzer
-    class TimeTrackerAnalyzerMock(TimeTrackerMock):
-        pass
-
-    TimeTrackerAnalyzer.register(TimeTrackerAnalyzerMock)
-
     dates_rng = DateRange(dt.date(2025, 1, 2), dt.date(2025, 2, 10))
 
-    mock = cast(
-        TimeTrackerAnalyzer,
-        TimeTrackerAnalyzerMock(
-            2025,
-            app_errors={
-                # Put something in the list to verify it doesn't appear
-                # in the results.
-                dt.date(2025, 1, 20): 20,
-            },
-            tracker_errors={
-                dt.date(2025, 1, 12): 40,
-            },
-            year_error=0,
-        ),
+    mock = make_mock(
+        analyzer=True,
+        app_errors={
+            # Put something in the list to verify it doesn't appear
+            # in the results.
+            dt.date(2025, 1, 20): 20,
+        },
+        tracker_errors={
+            dt.date(2025, 1, 12): 40,
+        },
+        year_error=0,
     )
 
     expected_errors = {}
@@ -256,95 +311,74 @@ def test_existing_errors_tracker_analyzer_abort():
     assert date_errors == expected_errors
 
 
-def test_scan_11_days_range():
+@pytest.mark.parametrize(
+    "end_date, checkers, expected_errors, expected_anchor",
+    [
+        # Setup 3 checkers in the validator that create a known errors
+        # sequence. Scan for 11 days and verify the sequence.
+        pytest.param(
+            dt.date(2025, 1, 20),
+            [
+                # First checker sets error 10 each 5 days
+                CustomChecker(10, days_multiple_of(5)),
+                # Second checker sets error 20 to pair days
+                CustomChecker(20, days_multiple_of(2)),
+                # Third checker sets error 30 each four days
+                CustomChecker(30, days_multiple_of(4)),
+            ],
+            {
+                dt.date(2025, 1, 10): 20,
+                dt.date(2025, 1, 12): 30,
+                dt.date(2025, 1, 14): 20,
+                dt.date(2025, 1, 15): 10,
+                dt.date(2025, 1, 16): 30,
+                dt.date(2025, 1, 18): 20,
+            },
+            # Anchor date moves to the first date with an error
+            dt.date(2025, 1, 10),
+            id="11_days",
+        ),
+        # Nothing is scanned if the validation anchor is the same day as
+        # `until` date
+        pytest.param(dt.date(2025, 1, 9), [], {}, None, id="nothing"),
+        # When no error is scanned, the anchor date is moved to the last
+        # date of the range (no error if no checker)
+        pytest.param(dt.date(2025, 1, 20), [], {}, dt.date(2025, 1, 20), id="no_error"),
+    ],
+)
+def test_scan_range(
+    make_mock: Callable[..., TimeTracker],
+    end_date: dt.date,
+    checkers: list[AttendanceChecker],
+    expected_errors: dict[dt.date, int],
+    expected_anchor: Optional[dt.date],
+):
     """
-    Setup 3 checkers in the validator that create a known errors sequence.
-    Scan for 11 days and verify the sequence.
+    Scan from the 09.01 to the given end date and check the errors found
+    and the returned anchor date.
     """
     start_date = dt.date(2025, 1, 9)
-    end_date = dt.date(2025, 1, 20)
-    mock = cast(TimeTracker, TimeTrackerMock(2025, anchor=start_date))
-
-    # First checker sets error 10 each 5 days
-    checker1 = CustomChecker(10, lambda _, date, __: date.day % 5 == 0)
-    # Second checker sets error 20 to pair days
-    checker2 = CustomChecker(20, lambda _, date, __: date.day % 2 == 0)
-    # Third checker sets error 30 each four days
-    checker3 = CustomChecker(30, lambda _, date, __: date.day % 4 == 0)
-
-    validator = CustomValidator([checker1, checker2, checker3])
-
-    results = {
-        dt.date(2025, 1, 10): 20,
-        dt.date(2025, 1, 12): 30,
-        dt.date(2025, 1, 14): 20,
-        dt.date(2025, 1, 15): 10,
-        dt.date(2025, 1, 16): 30,
-        dt.date(2025, 1, 18): 20,
-    }
+    mock = make_mock(anchor=start_date)
 
-    # Anchor date moves to the first date with an error
-    new_anchor = dt.date(2025, 1, 10)
+    validator = CustomValidator(checkers)
 
     date_errors = {}
     error_date = validator._scan_range(
         mock, date_errors, DateRange(start_date, end_date)
     )
 
-    assert date_errors == results
-    assert error_date == new_anchor
+    assert date_errors == expected_errors
+    assert error_date == expected_anchor
     # Check errors have been written in the tracker
-    assert cast(TimeTrackerMock, mock).set_errors == results
-
-
-def test_scan_until_nothing():
-    """
-    Check that nothing is scanned if the validation anchor is the same
-    day as `until` date.
-    """
-    start_date = dt.date(2025, 1, 9)
-    end_date = dt.date(2025, 1, 9)
-    mock = cast(TimeTracker, TimeTrackerMock(2025, anchor=start_date))
-
-    validator = CustomValidator([])
+    assert mock.set_errors == expected_errors  # type: ignore[attr-defined]
 
-    date_errors = {}
-    error_date = validator._scan_range(
-        mock, date_errors, DateRange(start_date, end_date)
-    )
-
-    assert date_errors == {}
-    assert error_date == None
-    assert cast(TimeTrackerMock, mock).set_errors == {}
-
-
-def test_scan_until_no_error():
-    """
-    Check that when no error is scanned, the anchor date is moved to
-    teh last date of the range.
-    """
-    start_date = dt.date(2025, 1, 9)
-    end_date = dt.date(2025, 1, 20)
-    mock = cast(TimeTracker, TimeTrackerMock(2025, anchor=start_date))
-
-    validator = CustomValidator([])  # No error if no checker
-
-    date_errors = {}
-    error_date = validator._scan_range(
-        mock, date_errors, DateRange(start_date, end_date)
-    )
-
-    assert date_errors == {}
-    assert error_date == end_date
-    assert cast(TimeTrackerMock, mock).set_errors == {}
 
-
-def test_validation_wrong_anchor():
+def test_validation_wrong_anchor(make_mock: Callable[..., TimeTracker]):
     """
     Check that the validator raises an exception if the validation anchor
     date is at the wrong year.
     """
-    mock = cast(TimeTracker, TimeTrackerMock(2025, anchor=dt.date(2023, 1, 1)))
+    mock = make_mock(anchor=dt.date(2023, 1, 1))
 
     validator = CustomValidator([])
     with pytest.raises(TimeTrackerDateException):
@@ -352,12 +386,12 @@ def test_validation_wrong_anchor():
         validator.validate(mock, dt.datetime(mock.tracked_year, 1, 1))
 
 
-def test_validation_wrong_until():
+def test_validation_wrong_until(make_mock: Callable[..., TimeTracker]):
     """
     Check that the validator raises an exception if the `until`
     date is at the wrong year.
     """
-    mock = cast(TimeTracker, TimeTrackerMock(2025, anchor=dt.date(2025, 1, 1)))
+    mock = make_mock(anchor=dt.date(2025, 1, 1))
 
     validator = CustomValidator([])
     with pytest.raises(TimeTrackerDateException):
@@ -365,329 +399,120 @@ def test_validation_wrong_until():
         validator.validate(mock, dt.datetime(2023, 1, 1))
 
 
-def test_full_validation_month_mode():
-    """
-    Integration test of the `validate()` function. Define a set of existing
-    application and tracker errors, use a checker that sets some custom
-    application errors and check the results.
-    """
-
-    # Make a mock class that virtually extends TimeTrackerAnalyzer
-    class TimeTrackerAnalyzerMock(TimeTrackerMock):
-        pass
-
-    TimeTrackerAnalyzer.register(TimeTrackerAnalyzerMock)
-
-    # Scan from [10.01 to 19.02]
-    anchor_date = dt.date(2025, 1, 10)
-    until = dt.datetime(2025, 2, 20, hour=8)
-
-    # Existing application and tracker errors
-    # In month mode, only errors of February will be reported
-    app_errors = {
-        dt.date(2025, 1, 2): 10,  # Out of reading range
-        dt.date(2025, 2, 5): 10,
-        dt.date(2025, 2, 20): 20,
-        dt.date(2025, 3, 10): 40,  # Out of reading range
-    }
-
-    tracker_errors = {
-        dt.date(2025, 1, 12): 40,  # Out of reading range
-        dt.date(2025, 2, 20): 30,
-        dt.date(2025, 3, 15): 50,  # Out of reading range
-    }
-
-    # The custom checker sets error 110 each 11 days
-    checker = CustomChecker(110, lambda _, date, __: date.day % 11 == 0)
-    validator = CustomValidator([checker])
-
-    # Scan from [10.01 to 19.02]
-    scanned_errors = {
-        dt.date(2025, 1, 11): 110,
-        dt.date(2025, 1, 22): 110,
-        dt.date(2025, 2, 11): 110,
-    }
-
-    expected_errors = {
-        dt.date(2025, 2, 5): 10,  # Reported by reading existing
-        dt.date(2025, 2, 20): 30,  # Reported by reading existing
-        dt.date(2025, 1, 11): 110,  # Reported by scan
-        dt.date(2025, 1, 22): 110,  # Reported by scan
-        dt.date(2025, 2, 11): 110,  # Reported by scan
-    }
-
-    # After validation, anchor date is moved to the first day in error
-    moved_anchor_date = dt.date(2025, 1, 11)
-
-    mock = cast(
-        TimeTrackerAnalyzer,
-        TimeTrackerAnalyzerMock(
-            2025,
-            anchor=anchor_date,
-            app_errors=app_errors,
-            tracker_errors=tracker_errors,
-            year_error=40,  # The analyzer reports the worse error up to February
-        ),
-    )
-
-    def to_error(eid: int):
-        return AttendanceError(eid, mock.get_attendance_error_desc(eid))
-
-    # Convert errors to an AttendanceError dictionary for comparison
-    expected_errors = {date: to_error(eid) for date, eid in expected_errors.items()}
-
-    status = validator.validate(mock, until, ErrorsReadMode.MONTH_ONLY)
-
-    assert status == AttendanceErrorStatus.ERROR  # ID 110 is an error
-    assert validator.date_errors == expected_errors
-    assert validator.dominant_error == to_error(110)
-    assert cast(TimeTrackerMock, mock).set_errors == scanned_errors
-    assert cast(TimeTrackerMock, mock).anchor == moved_anchor_date
-
-
-def test_full_validation_year_mode():
-    """
-    Integration test of the `validate()` function. Define a set of existing
-    application and tracker errors, use a checker that sets some custom
-    application errors and check the results.
-    """
-
-    # Make a mock class that virtually extends TimeTrackerAnalyzer
-    class TimeTrackerAnalyzerMock(TimeTrackerMock):
-        pass
-
-    TimeTrackerAnalyzer.register(TimeTrackerAnalyzerMock)
-
-    # Scan from [10.01 to 19.02]
-    anchor_date = dt.date(2025, 1, 10)
-    until = dt.datetime(2025, 2, 20, hour=8)
-
-    # Existing application and tracker errors
-    # In year mode, all errors are reported
-    app_errors = {
+# Existing application and tracker errors of the full validation tests
+FULL_APP_ERRORS = MappingProxyType(
+    {
         dt.date(2025, 1, 2): 10,
         dt.date(2025, 2, 5): 10,
         dt.date(2025, 2, 20): 20,
         dt.date(2025, 3, 10): 40,
     }
+)
 
-    tracker_errors = {
+FULL_TRACKER_ERRORS = MappingProxyType(
+    {
         dt.date(2025, 1, 12): 40,
         dt.date(2025, 2, 20): 30,
         dt.date(2025, 3, 15): 50,
     }
+)
 
-    # The custom checker sets error 110 each 11 days
-    checker = CustomChecker(110, lambda _, date, __: date.day % 11 == 0)
-    validator = CustomValidator([checker])
-
-    # Scan from [10.01 to 19.02]
-    scanned_errors = {
+# Errors set by a checker that sets error 110 each 11 days, when
+# scanning from [10.01 to 19.02]
+FULL_SCANNED_ERRORS = MappingProxyType(
+    {
         dt.date(2025, 1, 11): 110,
         dt.date(2025, 1, 22): 110,
         dt.date(2025, 2, 11): 110,
     }
+)
 
-    expected_errors = {
-        dt.date(2025, 1, 2): 10,  # Reported by reading existing
-        dt.date(2025, 2, 5): 10,  # Reported by reading existing
-        dt.date(2025, 3, 10): 40,  # Reported by reading existing
-        dt.date(2025, 1, 12): 40,  # Reported by reading existing
-        dt.date(2025, 2, 20): 30,  # Reported by reading existing
-        dt.date(2025, 3, 15): 50,  # Reported by reading existing
-        dt.date(2025, 1, 11): 110,  # Reported by scan
-        dt.date(2025, 1, 22): 110,  # Reported by scan
-        dt.date(2025, 2, 11): 110,  # Reported by scan
-    }
-
-    # After validation, anchor date is moved to the first day in error
-    # But it cannot move backward
-    moved_anchor_date = dt.date(2025, 1, 11)
 
-    mock = cast(
-        TimeTrackerAnalyzer,
-        TimeTrackerAnalyzerMock(
-            2025,
-            anchor=anchor_date,
-            app_errors=app_errors,
-            tracker_errors=tracker_errors,
-            year_error=40,  # The analyzer reports the worse error up to February
+@pytest.mark.parametrize(
+    "mode, existing_errors",
+    [
+        # In month mode, only errors of February are reported
+        pytest.param(
+            ErrorsReadMode.MONTH_ONLY,
+            {
+                dt.date(2025, 2, 5): 10,
+                dt.date(2025, 2, 20): 30,
+            },
+            id="month",
         ),
-    )
-
-    def to_error(eid: int):
-        return AttendanceError(eid, mock.get_attendance_error_desc(eid))
-
-    # Convert errors to an AttendanceError dictionary for comparison
-    expected_errors = {date: to_error(eid) for date, eid in expected_errors.items()}
-
-    status = validator.validate(mock, until, ErrorsReadMode.WHOLE_YEAR)
-
-    assert status == AttendanceErrorStatus.ERROR  # ID 110 is an error
-    assert validator.date_errors == expected_errors
-    assert validator.dominant_error == to_error(110)
-    assert cast(TimeTrackerMock, mock).set_errors == scanned_errors
-    assert cast(TimeTrackerMock, mock).anchor == moved_anchor_date
-
-
-def test_full_validation_validation_range_mode():
-    """
-    Integration test of the `validate()` function. Define a set of existing
-    application and tracker errors, use a checker that sets some custom
-    application errors and check the results.
-    """
-
-    # Make a mock class that virtually extends TimeTrackerAnalyzer
-    class TimeTrackerAnalyzerMock(TimeTrackerMock):
-        pass
-
-    TimeTrackerAnalyzer.register(TimeTrackerAnalyzerMock)
-
-    # Scan from [10.01 to 19.02]
-    anchor_date = dt.date(2025, 1, 10)
-    until = dt.datetime(2025, 2, 20, hour=8)
-
-    # Existing application and tracker errors
-    # The same range is used for scanning and reading existing errors
-    app_errors = {
-        dt.date(2025, 1, 2): 10,  # Out of reading range
-        dt.date(2025, 2, 5): 10,
-        dt.date(2025, 2, 20): 20,  # Out of reading range
-        dt.date(2025, 3, 10): 40,  # Out of reading range
-    }
-
-    tracker_errors = {
-        dt.date(2025, 1, 12): 40,
-        dt.date(2025, 2, 20): 30,  # Out of reading range
-        dt.date(2025, 3, 15): 50,  # Out of reading range
-    }
-
-    # The custom checker sets error 110 each 11 days
-    checker = CustomChecker(110, lambda _, date, __: date.day % 11 == 0)
-    validator = CustomValidator([checker])
-
-    # Scan from [10.01 to 19.02]
-    scanned_errors = {
-        dt.date(2025, 1, 11): 110,
-        dt.date(2025, 1, 22): 110,
-        dt.date(2025, 2, 11): 110,
-    }
-
-    expected_errors = {
-        dt.date(2025, 2, 5): 10,  # Reported by reading existing
-        dt.date(2025, 1, 12): 40,  # Reported by reading existing
-        dt.date(2025, 1, 11): 110,  # Reported by scan
-        dt.date(2025, 1, 22): 110,  # Reported by scan
-        dt.date(2025, 2, 11): 110,  # Reported by scan
-    }
-
-    # After validation, anchor date is moved to the first day in error
-    moved_anchor_date = dt.date(2025, 1, 11)
-
-    mock = cast(
-        TimeTrackerAnalyzer,
-        TimeTrackerAnalyzerMock(
-            2025,
-            anchor=anchor_date,
-            app_errors=app_errors,
-            tracker_errors=tracker_errors,
-            year_error=40,  # The analyzer reports the worse error up to February
+        # In year mode, all errors are reported
+        pytest.param(
+            ErrorsReadMode.WHOLE_YEAR,
+            {
+                dt.date(2025, 1, 2): 10,
+                dt.date(2025, 2, 5): 10,
+                dt.date(2025, 3, 10): 40,
+                dt.date(2025, 1, 12): 40,
+                dt.date(2025, 2, 20): 30,
+                dt.date(2025, 3, 15): 50,
+            },
+            id="year",
         ),
-    )
-
-    def to_error(eid: int):
-        return AttendanceError(eid, mock.get_attendance_error_desc(eid))
-
-    # Convert errors to an AttendanceError dictionary for comparison
-    expected_errors = {date: to_error(eid) for date, eid in expected_errors.items()}
-
-    status = validator.validate(mock, until, ErrorsReadMode.VALIDATION_RANGE_ONLY)
-
-    assert status == AttendanceErrorStatus.ERROR  # ID 110 is an error
-    assert validator.date_errors == expected_errors
-    assert validator.dominant_error == to_error(110)
-    assert cast(TimeTrackerMock, mock).set_errors == scanned_errors
-    assert cast(TimeTrackerMock, mock).anchor == moved_anchor_date
-
-
-def test_full_validation_no_read_mode():
+        # The same range is used for scanning and reading existing errors
+        pytest.param(
+            ErrorsReadMode.VALIDATION_RANGE_ONLY,
+            {
+                dt.date(2025, 2, 5): 10,
+                dt.date(2025, 1, 12): 40,
+            },
+            id="validation_range",
+        ),
+        # No existing error is read
+        pytest.param(ErrorsReadMode.NO_READ, {}, id="no_read"),
+    ],
+)
+def test_full_validation(
+    make_mock: Callable[..., TimeTracker],
+    mode: ErrorsReadMode,
+    existing_errors: dict[dt.date, int],
+):
     """
     Integration test of the `validate()` function. Define a set of existing
     application and tracker errors, use a checker that sets some custom
-    application errors and check the results.
+    application errors and check the results for each errors read mode.
     """
-
-    # Make a mock class that virtually extends TimeTrackerAnalyzer
-    class TimeTrackerAnalyzerMock(TimeTrackerMock):
-        pass
-
-    TimeTrackerAnalyzer.register(TimeTrackerAnalyzerMock)
-
     # Scan from [10.01 to 19.02]
     anchor_date = dt.date(2025, 1, 10)
     until = dt.datetime(2025, 2, 20, hour=8)
 
-    # Existing application and tracker errors
-    app_errors = {
-        dt.date(2025, 1, 2): 10,  # Out of reading range
-        dt.date(2025, 2, 5): 10,  # Out of reading range
-        dt.date(2025, 2, 20): 20,  # Out of reading range
-        dt.date(2025, 3, 10): 40,  # Out of reading range
-    }
-
-    tracker_errors = {
-        dt.date(2025, 1, 12): 40,  # Out of reading range
-        dt.date(2025, 2, 20): 30,  # Out of reading range
-        dt.date(2025, 3, 15): 50,  # Out of reading range
-    }
-
     # The custom checker sets error 110 each 11 days
-    checker = CustomChecker(110, lambda _, date, __: date.day % 11 == 0)
+    checker = CustomChecker(110, days_multiple_of(11))
     validator = CustomValidator([checker])
 
-    # Scan from [10.01 to 19.02]
-    scanned_errors = {
-        dt.date(2025, 1, 11): 110,
-        dt.date(2025, 1, 22): 110,
-        dt.date(2025, 2, 11): 110,
-    }
-
-    expected_errors = {
-        dt.date(2025, 1, 11): 110,  # Reported by scan
-        dt.date(2025, 1, 22): 110,  # Reported by scan
-        dt.date(2025, 2, 11): 110,  # Reported by scan
-    }
+    # Existing errors read for the mode plus the scanned ones
+    expected_errors = existing_errors | FULL_SCANNED_ERRORS
 
     # After validation, anchor date is moved to the first day in error
     moved_anchor_date = dt.date(2025, 1, 11)
 
-    mock = cast(
-        TimeTrackerAnalyzer,
-        TimeTrackerAnalyzerMock(
-            2025,
-            anchor=anchor_date,
-            app_errors=app_errors,
-            tracker_errors=tracker_errors,
-            year_error=40,  # The analyzer reports the worse error up to February
-        ),
+    mock = make_mock(
+        analyzer=True,
+        anchor=anchor_date,
+        app_errors=FULL_APP_ERRORS,
+        tracker_errors=FULL_TRACKER_ERRORS,
+        year_error=40,  # The analyzer reports the worse error up to February
     )
 
-    def to_error(eid: int):
-        return AttendanceError(eid, mock.get_attendance_error_desc(eid))
-
     # Convert errors to an AttendanceError dictionary for comparison
     expected_errors = {date: to_error(eid) for date, eid in expected_errors.items()}
 
-    status = validator.validate(mock, until, ErrorsReadMode.NO_READ)
+    status = validator.validate(mock, until, mode)
 
     assert status == AttendanceErrorStatus.ERROR  # ID 110 is an error
     assert validator.date_errors == expected_errors
     assert validator.dominant_error == to_error(110)
-    assert cast(TimeTrackerMock, mock).set_errors == scanned_errors
-    assert cast(TimeTrackerMock, mock).anchor == moved_anchor_date
+    assert mock.set_errors == FULL_SCANNED_ERRORS  # type: ignore[attr-defined]
+    assert mock.anchor == moved_anchor_date  # type: ignore[attr-defined]
 
 
-def test_full_validation_month_mode_simple_tracker_has_error():
+def test_full_validation_month_mode_simple_tracker_has_error(
+    make_mock: Callable[..., TimeTracker],
+):
     """
     Integration test of the `validate()` function. Define a set of existing
     application and tracker errors, use a checker that sets some custom
@@ -707,7 +532,7 @@ def test_full_validation_month_mode_simple_tracker_has_error():
     }
 
     # The custom checker sets error 110 each 11 days
-    checker = CustomChecker(110, lambda _, date, __: date.day % 11 == 0)
+    checker = CustomChecker(110, days_multiple_of(11))
     validator = CustomValidator([checker])
 
     # Scan from [10.01 to 19.02]
@@ -721,19 +546,12 @@ def test_full_validation_month_mode_simple_tracker_has_error():
     # Anchor date hasn't moved because no scan was performed
     moved_anchor_date = anchor_date
 
-    mock = cast(
-        TimeTracker,
-        TimeTrackerMock(
-            2025,
-            anchor=anchor_date,
-            app_errors=app_errors,
-            year_error=40,  # The analyzer reports the worse error up to February
-        ),
+    mock = make_mock(
+        anchor=anchor_date,
+        app_errors=app_errors,
+        year_error=40,  # The analyzer reports the worse error up to February
     )
 
-    def to_error(eid: int):
-        return AttendanceError(eid, mock.get_attendance_error_desc(eid))
-
     # Convert errors to an AttendanceError dictionary for comparison
     expected_errors = {date: to_error(eid) for date, eid in expected_errors.items()}
 
@@ -742,5 +560,5 @@ def test_full_validation_month_mode_simple_tracker_has_error():
     assert status == AttendanceErrorStatus.ERROR  # ID 120 is an error
     assert validator.date_errors == expected_errors
     assert validator.dominant_error == to_error(120)
-    assert cast(TimeTrackerMock, mock).set_errors == scanned_errors
-    assert cast(TimeTrackerMock, mock).anchor == moved_anchor_date
+    assert mock.set_errors == scanned_errors  # type: ignore[attr-defined]
+    assert mock.anchor == moved_anchor_date  # type: ignore[attr-defined]
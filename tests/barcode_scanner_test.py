@@ -7,8 +7,11 @@ import cv2
 import pyvirtualcam
 import threading
 import pathlib
-import time
-from typing import Generator
+import re
+from typing import Generator, Optional
+
+# Third-party
+import numpy as np
 
 # Internal libraries
 from platform_io.barcode_scanner import BarcodeScanner
@@ -21,24 +24,155 @@ from platform_io.barcode_scanner import BarcodeScanner
 # id of the virtual camera created by OBS Studio.
 VIRTUAL_CAM_IDX = 1  # 0 is typically the embedded camera and 1 the virtual one
 # Regular expression to use to identify employee's id
-EMPLOYEE_REGEX = r"teambridge@(\w+)"
+EMPLOYEE_REGEX = re.compile(r"teambridge@(\w+)")
 # Group to extract ID
 EMPLOYEE_REGEX_GROUP = 1
+# Maximum time to wait for an expected id to be scanned [s]
+SCAN_TIMEOUT = 10.0
+# Time to wait before concluding that nothing is scanned, enough for one
+# loop of the test videos [s]
+NO_SCAN_TIMEOUT = 6.0
+# Virtual camera format, the played videos are resized to fit
+VIRTUAL_CAM_WIDTH = 720
+VIRTUAL_CAM_HEIGHT = 1280
+VIRTUAL_CAM_FPS = 30
 
 ########################################################################
 #                               Fixtures                               #
 ########################################################################
 
 
+class VirtualCamFeeder:
+    """
+    Play video files in a virtual camera device. The camera is opened
+    once and the played video can be switched, which is much faster
+    than reopening a virtual camera for each video. The videos are
+    decoded once and resized to the camera dimensions. This class uses
+    pyvirtualcam and requires OBS studio to be installed on the system.
+    """
+
+    def __init__(self, cam: pyvirtualcam.Camera):
+        """
+        Start feeding the given camera in a background thread.
+
+        Args:
+            cam (pyvirtualcam.Camera): The opened virtual camera.
+        """
+        self._cam = cam
+        # Decoded frames of the video currently played and index of the
+        # next frame to send, protected by the lock
+        self._frames: list[np.ndarray] = []
+        self._index = 0
+        self._lock = threading.Lock()
+        # Set once the current video starts to be played
+        self._playing = threading.Event()
+        # Running flag of the feeder thread
+        self._running = threading.Event()
+        self._running.set()
+        self._thread = threading.Thread(target=self.__run, name="VirtualCam-Feeder")
+        self._thread.start()
+
+    def __run(self):
+        """
+        Feeder thread running function.
+        """
+        shape = (self._cam.height, self._cam.width, 3)
+        # Black frame sent while no video is played
+        blank = np.zeros(shape, np.uint8)
+        # Buffer reused for each frame, the camera copies the sent frame
+        rgb = np.empty(shape, np.uint8)
+
+        while self._running.is_set():
+            frame = blank
+            with self._lock:
+                if self._frames:
+                    # Send the video in loop
+                    gray = self._frames[self._index]
+                    self._index = (self._index + 1) % len(self._frames)
+                    frame = cv2.cvtColor(gray, cv2.COLOR_GRAY2RGB, dst=rgb)
+                    self._playing.set()
+
+            # Send the frame to the virtual camera
+            self._cam.send(frame)  # type: ignore
+            # Synchronize with the camera fps value
+            self._cam.sleep_until_next_frame()
+
+    def play(self, video_path: str):
+        """
+        Play the given video file in loop, until another video is played
+        or `stop()` is called. Return when the video starts to be played.
+
+        Args:
+            video_path (str): Path to the video file.
+        """
+        # Open the video file and assert that the capture is opened
+        capture = cv2.VideoCapture(video_path)
+        assert capture.isOpened()
+
+        # Decode the whole video once, instead of decoding it again at
+        # each loop. The frames are kept in grayscale to limit the memory
+        # footprint, which doesn't matter to scan barcodes.
+        frames: list[np.ndarray] = []
+        while True:
+            ret, frame = capture.read()
+            if not ret:
+                break
+            frame = cv2.resize(frame, (self._cam.width, self._cam.height))
+            frames.append(cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY))
+        capture.release()
+        assert frames
+
+        with self._lock:
+            self._frames = frames
+            self._index = 0
+            self._playing.clear()
+
+        # Wait for the video to be played, expected in 5 seconds
+        assert self._playing.wait(timeout=5)
+
+    def stop(self):
+        """
+        Stop playing the current video.
+        """
+        with self._lock:
+            self._frames = []
+
+    def close(self):
+        """
+        Stop playing and finish the feeder thread.
+        """
+        self._running.clear()
+        self._thread.join()
+        self.stop()
+
+
+@pytest.fixture(scope="session")
+def virtual_cam() -> Generator[VirtualCamFeeder, None, None]:
+    """
+    Create and open the virtual camera once for the session.
+
+    Yields:
+        VirtualCamFeeder: the feeder that plays videos in the camera
+    """
+    with pyvirtualcam.Camera(
+        VIRTUAL_CAM_WIDTH, VIRTUAL_CAM_HEIGHT, fps=VIRTUAL_CAM_FPS
+    ) as cam:
+        feeder = VirtualCamFeeder(cam)
+        yield feeder
+        feeder.close()
+
+
 @pytest.fixture(
     params=[
         ("tests/assets/qrscan-000.mp4", None),  # '000' doesn't match regular expression
         ("tests/assets/qrscan-teambridge@543.mp4", "543"),  # Shall identify id '543'
     ]
 )
-def open_virtual_device(request: FixtureRequest) -> Generator[str, None, None]:
+def open_virtual_device(
+    request: FixtureRequest, virtual_cam: VirtualCamFeeder
+) -> Generator[Optional[str], None, None]:
     """
-    Create, open the virtual camera and play a file given as parameter.
+    Play a file given as parameter in the virtual camera.
 
     Yields:
         str: the ID that shall be found in the playing video
@@ -49,72 +183,11 @@ def open_virtual_device(request: FixtureRequest) -> Generator[str, None, None]:
     # Ensure the path exists
     assert pathlib.Path(video_path).exists()
 
-    # Create a running flag for the video feeder thread
-    run_feeder = threading.Event()
-    # Create a running status for the video feeder thread
-    status_feeder = threading.Event()
-
-    # Video player task
-    def video_player_task():
-        """
-        Read the given capture and play the frames in a
-        virtual camera device. This function uses pyvirtualcam
-        and require OBS studio to be installed on the system.
-        """
-        # Open the video file
-        capture = cv2.VideoCapture(video_path)
-        # Assert that the capture is opened
-        assert capture.isOpened()
-
-        # Get video properties
-        width = int(capture.get(cv2.CAP_PROP_FRAME_WIDTH))
-        height = int(capture.get(cv2.CAP_PROP_FRAME_HEIGHT))
-        fps = int(capture.get(cv2.CAP_PROP_FPS))
-        print(
-            f"Going to play {video_path} with dimension {width}x{height}px at {fps} fps."
-        )
-
-        # Create and open the virtual camera
-        with pyvirtualcam.Camera(width, height, fps=fps) as cam:
-            # Run while feeder flag is set
-            while run_feeder.is_set():
-                # Read the next frame
-                ret, frame = capture.read()
-                # Check status flag
-                if ret:
-                    # Frame successfully readen
-                    # Convert BGR to RGB
-                    frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    # Send the frame to the virtual camera
-                    cam.send(frame)  # type: ignore
-                    # Synchronize with given fps value
-                    cam.sleep_until_next_frame()
-                    # Set the running status, first frame has been sent
-                    status_feeder.set()
-                else:
-                    # The read failed
-                    # Restart video while the capture is open
-                    capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
-        # Release the capture
-        capture.release()
-
-    # Run the video player task in a background thread
-    video_task = threading.Thread(target=video_player_task, name="VirtualCam-Feeder")
-    # Set the running flag and start the thread
-    run_feeder.set()
-    video_task.start()
-
-    # Wait for the feeder to be started, expected in 5 seconds.
-    if not status_feeder.wait(timeout=5):
-        assert False
+    virtual_cam.play(video_path)
     # Run the test
     yield expected_id
-
-    # Once test done, reset the flag and join the thread
-    run_feeder.clear()
-    video_task.join()
-    # Add a little delay before starting next virtual camera, usually not required
-    time.sleep(0.1)
+    # Once test done, stop playing the video
+    virtual_cam.stop()
 
 
 @pytest.fixture
@@ -140,17 +213,35 @@ def prepare_scanner(
     scanner.close(join=True)
 
 
+@pytest.fixture
+def prepare_scanner_no_cam(
+    monkeypatch: pytest.MonkeyPatch,
+) -> Generator[BarcodeScanner, None, None]:
+    """
+    Create and open a barcode scanner whose scanning thread returns
+    immediately, for tests that don't need a video feed.
+
+    Yields:
+        BarcodeScanner: the opened scanner
+    """
+    scanner = BarcodeScanner()
+    # The thread never touches the camera, the scanner stays running
+    monkeypatch.setattr(scanner, "_BarcodeScanner__run", lambda: None)
+    scanner.open(cam_idx=VIRTUAL_CAM_IDX, scan_rate=5)
+    yield scanner
+    scanner.close(join=True)
+
+
 ################################################
 #                    Tests                     #
 ################################################
 
 
-def test_multiple_open(prepare_scanner: tuple[BarcodeScanner, str]):
+def test_multiple_open(prepare_scanner_no_cam: BarcodeScanner):
     """
     Try to reopen an already opened scanner and verify it throws an exception.
     """
-    # Retrieve scanner and expected ID
-    scanner, _ = prepare_scanner
+    scanner = prepare_scanner_no_cam
     # Reopen
     with pytest.raises(RuntimeError):
         # An exception is raised because the scanner is already running
@@ -161,11 +252,11 @@ def test_clear_scanner(prepare_scanner: tuple[BarcodeScanner, str]):
     """
     Wait for an id to be scanned and clear the scanner.
     """
-    scanner, _ = prepare_scanner
+    scanner, expected_id = prepare_scanner
+    if expected_id is None:
+        pytest.skip("no code to clear")
     # Wait for an id to be scanned
-    timeout = time.time() + 10.0
-    while not scanner.available() and timeout > time.time():
-        time.sleep(0.1)
+    scanner.wait_available(timeout=SCAN_TIMEOUT)
     # Check if an element is available
     if scanner.available():
         # Clear and assert no element is available
@@ -184,10 +275,9 @@ def test_scan_id(prepare_scanner: tuple[BarcodeScanner, str]):
     """
     # Retrieve scanner and expected ID
     scanner, expected_id = prepare_scanner
-    # Wait for an id to be scanned
-    timeout = time.time() + 10.0
-    while not scanner.available() and timeout > time.time():
-        time.sleep(0.1)
+    # Wait for an id to be scanned. When no id is expected, the wait only
+    # lasts one loop of the video.
+    scanner.wait_available(timeout=SCAN_TIMEOUT if expected_id else NO_SCAN_TIMEOUT)
     # Assert the expected id has been scanned
     if expected_id:
         assert scanner.available()
@@ -3,11 +3,14 @@
 # Standard libraries
 import logging
 from pytest import MonkeyPatch
-from typing import Any
+from typing import Any, Callable, Optional, Sequence
+import datetime as dt
+from collections import deque
 
 # Internal libraries
 from tests.test_constants import *
 from platform_io.barcode_scanner import BarcodeScanner
+from core.time_tracker import TimeTracker, ClockEvent
 
 logger = logging.getLogger(__name__)
 
@@ -49,7 +52,7 @@ class BarcodeScannerMock:
         monkeypatch.setattr(scanner, "is_scanning", self.__is_scanning)
 
         # Mock result queue
-        self._results: list[str] = []
+        self._results: deque[str] = deque()
         monkeypatch.setattr(scanner, "available", self.__available)
         monkeypatch.setattr(scanner, "read_next", self.__read_next)
 
@@ -58,42 +61,42 @@ class BarcodeScannerMock:
         Stub method that does nothing (used to replace non-essential
         scanner methods).
         """
-        logger.debug(f"[{self.__class__.__name__}] configure() stub call.")
+        logger.debug("[%s] configure() stub call.", self.__class__.__name__)
 
     def __open(self, *args: tuple[Any], **kwargs: dict[Any, Any]):
         """
         Stub method that does nothing (used to replace non-essential
         scanner methods).
         """
-        logger.debug(f"[{self.__class__.__name__}] open() stub call.")
+        logger.debug("[%s] open() stub call.", self.__class__.__name__)
 
     def __clear(self, *args: tuple[Any], **kwargs: dict[Any, Any]):
         """
         Stub method that does nothing (used to replace non-essential
         scanner methods).
         """
-        logger.debug(f"[{self.__class__.__name__}] clear() stub call.")
+        logger.debug("[%s] clear() stub call.", self.__class__.__name__)
 
     def __close(self, *args: tuple[Any], **kwargs: dict[Any, Any]):
         """
         Stub method that does nothing (used to replace non-essential
         scanner methods).
         """
-        logger.debug(f"[{self.__class__.__name__}] close() stub call.")
+        logger.debug("[%s] close() stub call.", self.__class__.__name__)
 
     def __pause(self, *args: tuple[Any], **kwargs: dict[Any, Any]):
         """
         Stub method that does nothing (used to replace non-essential
         scanner methods).
         """
-        logger.debug(f"[{self.__class__.__name__}] pause() stub call.")
+        logger.debug("[%s] pause() stub call.", self.__class__.__name__)
 
     def __resume(self, *args: tuple[Any], **kwargs: dict[Any, Any]):
         """
         Stub method that does nothing (used to replace non-essential
         scanner methods).
         """
-        logger.debug(f"[{self.__class__.__name__}] resume() stub call.")
+        logger.debug("[%s] resume() stub call.", self.__class__.__name__)
 
     def __is_scanning(self) -> bool:
         """Return the current mocked scanning state."""
@@ -101,11 +104,11 @@ class BarcodeScannerMock:
 
     def __available(self) -> bool:
         """Return True if there are mock scan results available to read."""
-        return len(self._results) > 0
+        return bool(self._results)
 
     def __read_next(self) -> str:
         """Return and remove the next mock scan result from the queue."""
-        return self._results.pop()
+        return self._results.popleft()
 
     def set_scanning(self, value: bool):
         """
@@ -125,3 +128,36 @@ class BarcodeScannerMock:
             result (str): A string representing a barcode value to simulate.
         """
         self._results.append(result)
+
+
+########################################################################
+#                       Clock events tracker mock                      #
+########################################################################
+
+
+class ClocksTrackerMock:
+    """
+    Minimal time tracker mock that only provides the clock events and
+    the maximum continuous work time, as used by the attendance
+    checkers.
+    """
+
+    def __init__(self, evts: dict[dt.date, list[Optional[ClockEvent]]]):
+        """
+        Args:
+            evts (dict[dt.date, list[Optional[ClockEvent]]]): Clock events
+                by date. Missing dates have no events.
+        """
+        # Immutable events, returned as is without copy
+        self._evts = {date: tuple(date_evts) for date, date_evts in evts.items()}
+
+    def get_clocks(self, date: dt.date) -> Sequence[Optional[ClockEvent]]:
+        return self._evts.get(date, ())
+
+    @property
+    def max_continuous_work_time(self) -> dt.timedelta:
+        return dt.timedelta(hours=6)
+
+
+# Creates a `ClocksTrackerMock` from clock events by date
+ClocksMockFactory = Callable[[dict[dt.date, list[Optional[ClockEvent]]]], TimeTracker]
@@ -62,6 +62,16 @@ TEST_CONFIG = textwrap.dedent(
     """
 )
 
+
+@pytest.fixture(scope="session")
+def compiled_schema() -> dict[str, dict[str, _SchemaEntry]]:
+    """
+    Parse the test schema once for the session, it is never modified by
+    the parsers using it.
+    """
+    return ConfigParser.parse_schema(io.StringIO(TEST_SCHEMA))
+
+
 ########################################################################
 #                           Schema entry test                          #
 ########################################################################
@@ -255,7 +265,9 @@ def test_generate_default_config():
     assert default_config.read() == TEST_CONFIG
 
 
-def test_generate_config_not_existing(arrange_assets: None):
+def test_generate_config_not_existing(
+    arrange_assets: None, compiled_schema: dict[str, dict[str, _SchemaEntry]]
+):
     """
     Check that the default configuration is created if the file is not
     existing.
@@ -263,7 +275,7 @@ def test_generate_config_not_existing(arrange_assets: None):
     config_path = Path(TEST_ASSETS_DST_FOLDER) / "test_config.ini"
     assert not config_path.exists()
 
-    ConfigParser(io.StringIO(TEST_SCHEMA), str(config_path.resolve()))
+    ConfigParser(compiled_schema, str(config_path.resolve()))
 
     assert config_path.exists()
 
@@ -271,13 +283,11 @@ def test_generate_config_not_existing(arrange_assets: None):
         assert file.read() == TEST_CONFIG
 
 
-def test_read_config():
+def test_read_config(compiled_schema: dict[str, dict[str, _SchemaEntry]]):
     """
     Parse and validate a configuration and read the values.
     """
-    parser = ConfigParser(
-        io.StringIO(TEST_SCHEMA), io.StringIO(TEST_CONFIG), name="test-config"
-    )
+    parser = ConfigParser(compiled_schema, io.StringIO(TEST_CONFIG), name="test-config")
 
     view = parser.get_view()
     assert view["section1"]["number"] == 8
@@ -286,7 +296,7 @@ def test_read_config():
     assert view["section2"]["floating"] == approx(3.14)
 
 
-def test_extra_section_raises():
+def test_extra_section_raises(compiled_schema: dict[str, dict[str, _SchemaEntry]]):
     """
     Test that the configuration validation fails if it contains extra
     sections.
@@ -294,12 +304,10 @@ def test_extra_section_raises():
     wrong_config = TEST_CONFIG + "[extra_section]\n"
 
     with pytest.raises(ConfigError, match="\\+extra_section"):
-        ConfigParser(
-            io.StringIO(TEST_SCHEMA), io.StringIO(wrong_config), name="test-config"
-        )
+        ConfigParser(compiled_schema, io.StringIO(wrong_config), name="test-config")
 
 
-def test_extra_key_raises():
+def test_extra_key_raises(compiled_schema: dict[str, dict[str, _SchemaEntry]]):
     """
     Test that the configuration validation fails if it contains extra
     keys.
@@ -312,12 +320,10 @@ def test_extra_key_raises():
     wrong_config = "\n".join(wrong_config)
 
     with pytest.raises(ConfigError, match="\\+random_key"):
-        ConfigParser(
-            io.StringIO(TEST_SCHEMA), io.StringIO(wrong_config), name="test-config"
-        )
+        ConfigParser(compiled_schema, io.StringIO(wrong_config), name="test-config")
 
 
-def test_invalid_type_raises():
+def test_invalid_type_raises(compiled_schema: dict[str, dict[str, _SchemaEntry]]):
     """
     Test that the configuration validation fails if a value has not the
     expected type.
@@ -331,19 +337,15 @@ def test_invalid_type_raises():
     wrong_config = "\n".join(wrong_config)
 
     with pytest.raises(ConfigError, match="type error"):
-        ConfigParser(
-            io.StringIO(TEST_SCHEMA), io.StringIO(wrong_config), name="test-config"
-        )
+        ConfigParser(compiled_schema, io.StringIO(wrong_config), name="test-config")
 
 
-def test_set_value():
+def test_set_value(compiled_schema: dict[str, dict[str, _SchemaEntry]]):
     """
     Change a value and verify it is reflected in the previously retrieved
     view.
     """
-    parser = ConfigParser(
-        io.StringIO(TEST_SCHEMA), io.StringIO(TEST_CONFIG), name="test-config"
-    )
+    parser = ConfigParser(compiled_schema, io.StringIO(TEST_CONFIG), name="test-config")
 
     view = parser.get_view()
 
@@ -351,14 +353,16 @@ def test_set_value():
     assert view["section2"]["floating"] == approx(4.68)
 
 
-def test_set_value_file(arrange_assets: None):
+def test_set_value_file(
+    arrange_assets: None, compiled_schema: dict[str, dict[str, _SchemaEntry]]
+):
     """
     Change a value and verify it has been written in the configuration
     file (.ini).
     """
     config_path = Path(TEST_ASSETS_DST_FOLDER) / "test_config.ini"
 
-    parser = ConfigParser(io.StringIO(TEST_SCHEMA), str(config_path.resolve()))
+    parser = ConfigParser(compiled_schema, str(config_path.resolve()))
     parser.set_value("section2", "floating", 4.68)
 
     content = TEST_CONFIG.replace("floating = 3.14", "floating = 4.68")
@@ -366,26 +370,24 @@ def test_set_value_file(arrange_assets: None):
         assert file.read() == content
 
 
-def test_set_value_missing_key_raises():
+def test_set_value_missing_key_raises(
+    compiled_schema: dict[str, dict[str, _SchemaEntry]],
+):
     """
     Check that trying to set a value for a missing key raises.
     """
-    parser = ConfigParser(
-        io.StringIO(TEST_SCHEMA), io.StringIO(TEST_CONFIG), name="test-config"
-    )
+    parser = ConfigParser(compiled_schema, io.StringIO(TEST_CONFIG), name="test-config")
 
     with pytest.raises(ConfigError, match="key"):
         parser.set_value("section1", "unexisting", True)
 
 
-def test_set_wrong_value_raises():
+def test_set_wrong_value_raises(compiled_schema: dict[str, dict[str, _SchemaEntry]]):
     """
     Check that trying to set a value that doesn't match the schema rules
     raises.
     """
-    parser = ConfigParser(
-        io.StringIO(TEST_SCHEMA), io.StringIO(TEST_CONFIG), name="test-config"
-    )
+    parser = ConfigParser(compiled_schema, io.StringIO(TEST_CONFIG), name="test-config")
 
     with pytest.raises(ConfigError, match="schema rules"):
         # This parameter must be greater than 2.0
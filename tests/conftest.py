@@ -6,13 +6,21 @@ from pytest import MonkeyPatch
 import pathlib
 import shutil
 import os
-from typing import Generator
+from typing import Generator, Optional, cast
+import datetime as dt
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
 
 # Internal libraries
 from .test_constants import *
-from .classes_mocks import BarcodeScannerMock
+from .classes_mocks import BarcodeScannerMock, ClocksTrackerMock, ClocksMockFactory
+from core.time_tracker import TimeTracker, ClockEvent
 from core.time_tracker_factory import TimeTrackerFactory
 from core.spreadsheets.sheet_time_tracker_factory import SheetTimeTrackerFactory
+from core.spreadsheets import sheets_repository
 from model.teambridge_scheduler import TeamBridgeScheduler
 from viewmodel.teambridge_viewmodel import TeamBridgeViewModel
 from platform_io.barcode_scanner import BarcodeScanner
@@ -21,12 +29,66 @@ from platform_io.barcode_scanner import BarcodeScanner
 #                          Assets arrangement                          #
 ########################################################################
 
+# Copy-on-write clone request, only available on Linux
+_FICLONE = getattr(fcntl, "FICLONE", None)
 
-@pytest.fixture
-def arrange_assets():
+
+def _fast_clone(src: str, dst: str) -> str:
+    """
+    Copy a file as a copy-on-write clone when the file system supports
+    it, or make a regular copy otherwise. Hard links are not an option
+    since the tests write the spreadsheets in place.
+    """
+    if fcntl and _FICLONE:
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            shutil.copystat(src, dst)
+            return dst
+        except OSError:
+            pass  # Not supported by the file system
+
+    return shutil.copy2(src, dst)
+
+
+def _remove_readonly(func, path, exc_info):  # type: ignore
     """
-    This pytest fixture prepares the test assets. It removes any existing
-    old test asset folders and creates a new one.
+    Changes the file attribute and retries deletion if permission is denied.
+    """
+    os.chmod(path, 0o777)  # type: ignore # Grant full permissions
+    func(path)  # Retry the function
+
+
+@pytest.fixture(scope="session", autouse=True)
+def worker_local_cache() -> Generator[None, None, None]:
+    """
+    Give each pytest-xdist worker its own spreadsheets local cache, the
+    default one is shared by all the processes started in the working
+    directory.
+    """
+    if not TEST_WORKER_ID:
+        yield
+        return
+
+    with MonkeyPatch.context() as mp:
+        mp.setattr(
+            sheets_repository,
+            "SHEETS_LOCAL_CACHE",
+            f"{sheets_repository.SHEETS_LOCAL_CACHE}-{TEST_WORKER_ID}",
+        )
+        yield
+
+
+@pytest.fixture(scope="session")
+def assets_manifest() -> dict[str, tuple[int, int]]:
+    """
+    Arrange the test assets folder once for the session. Removes any
+    existing old test asset folder and creates a new one.
+
+    Returns:
+        dict[str, tuple[int, int]]: Size and modification time of the
+            arranged files by relative path, used to detect the files
+            a test has changed.
     """
     assets_src = pathlib.Path(TEST_ASSETS_SRC_FOLDER)
     assets_dst = pathlib.Path(TEST_ASSETS_DST_FOLDER)
@@ -37,18 +99,59 @@ def arrange_assets():
         )
 
     if assets_dst.exists():
+        # Remove old test assets folder
+        shutil.rmtree(assets_dst, onexc=_remove_readonly)  # type: ignore
 
-        def remove_readonly(func, path, exc_info):  # type: ignore
-            """
-            Changes the file attribute and retries deletion if permission is denied.
-            """
-            os.chmod(path, 0o777)  # type: ignore # Grant full permissions
-            func(path)  # Retry the function
+    shutil.copytree(assets_src, assets_dst, copy_function=_fast_clone)
 
-        # Remove old test assets folder
-        shutil.rmtree(assets_dst, onexc=remove_readonly)  # type: ignore
+    manifest: dict[str, tuple[int, int]] = {}
+    for root, _, files in os.walk(assets_dst):
+        for file in files:
+            path = os.path.join(root, file)
+            stat = os.stat(path)
+            manifest[os.path.relpath(path, assets_dst)] = (
+                stat.st_size,
+                stat.st_mtime_ns,
+            )
+    return manifest
 
-    shutil.copytree(assets_src, assets_dst)
+
+@pytest.fixture
+def arrange_assets(assets_manifest: dict[str, tuple[int, int]]):
+    """
+    This pytest fixture prepares the test assets. The folder is arranged
+    once for the session, then only the files and folders changed by
+    the previous tests are restored.
+    """
+    assets_src = pathlib.Path(TEST_ASSETS_SRC_FOLDER)
+    assets_dst = pathlib.Path(TEST_ASSETS_DST_FOLDER)
+
+    # Remove the changed and extra files, then the extra folders
+    kept_dirs: set[str] = set()
+    for root, _, files in os.walk(assets_dst, topdown=False):
+        for file in files:
+            path = os.path.join(root, file)
+            rel_path = os.path.relpath(path, assets_dst)
+            stat = os.stat(path)
+            if assets_manifest.get(rel_path) == (stat.st_size, stat.st_mtime_ns):
+                kept_dirs.add(os.path.dirname(rel_path))
+            else:
+                os.chmod(path, 0o777)  # Grant full permissions
+                os.remove(path)
+
+        rel_root = os.path.relpath(root, assets_dst)
+        if rel_root != "." and not any(
+            rel_dir == rel_root or rel_dir.startswith(rel_root + os.sep)
+            for rel_dir in kept_dirs
+        ):
+            shutil.rmtree(root, onexc=_remove_readonly)  # type: ignore
+
+    # Restore the missing files
+    for rel_path in assets_manifest:
+        path = assets_dst / rel_path
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            _fast_clone(str(assets_src / rel_path), str(path))
 
 
 @pytest.fixture
@@ -85,3 +188,21 @@ def viewmodel_scanner(
 
     yield viewmodel, scanner_mock
     viewmodel.close()
+
+
+########################################################################
+#                          Time tracker mocks                          #
+########################################################################
+
+
+@pytest.fixture(scope="session")
+def clocks_mock_factory() -> ClocksMockFactory:
+    """
+    Get a factory that creates a `ClocksTrackerMock` for the given clock
+    events by date.
+    """
+
+    def make(evts: dict[dt.date, list[Optional[ClockEvent]]]) -> TimeTracker:
+        return cast(TimeTracker, ClocksTrackerMock(evts))
+
+    return make
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+
+# Standard libraries
+import pytest
+
+# Internal libraries
+from common.live_data import LiveData
+
+
+def test_observe_on_change():
+    """
+    Observers are notified only when the value changes, unless the
+    bus mode is enabled.
+    """
+    received: list[int] = []
+    data = LiveData[int](0)
+    data.observe(received.append)
+
+    data.value = 1
+    data.value = 1
+    data.value = 2
+    assert received == [1, 2]
+
+    bus_received: list[int] = []
+    bus = LiveData[int](0, bus_mode=True)
+    bus.observe(bus_received.append)
+
+    bus.value = 1
+    bus.value = 1
+    assert bus_received == [1, 1]
+
+
+def test_batch():
+    """
+    Notifications are deferred until the end of the batch and sent
+    once with the last value.
+    """
+    received_a: list[str] = []
+    received_b: list[str] = []
+    data_a = LiveData[str]("")
+    data_b = LiveData[str]("")
+    data_a.observe(received_a.append)
+    data_b.observe(received_b.append)
+
+    with LiveData.batch(data_a, data_b):
+        data_a.value = "first"
+        data_a.value = "second"
+        # The value is readable inside the batch
+        assert data_a.value == "second"
+        # Back to the initial value: nothing to notify
+        data_b.value = "temporary"
+        data_b.value = ""
+        assert received_a == []
+
+    assert received_a == ["second"]
+    assert received_b == []
+
+
+def test_batch_order():
+    """
+    The batched live data are notified in the given order, and every
+    value is final when the first notification is sent.
+    """
+    received: list[tuple[str, str]] = []
+    text = LiveData[str]("")
+    state = LiveData[str]("")
+    text.observe(lambda value: received.append((value, state.value)))
+    state.observe(lambda value: received.append((text.value, value)))
+
+    with LiveData.batch(text, state):
+        state.value = "state"
+        text.value = "text"
+
+    assert received == [("text", "state"), ("text", "state")]
+
+
+def test_batch_observer_raises():
+    """
+    An observer raising while a batch is notified doesn't leave the
+    other live data in the batch.
+    """
+    received: list[int] = []
+    data_a = LiveData[int](0)
+    data_b = LiveData[int](0)
+
+    def fail(_: int):
+        raise RuntimeError("Observer failure")
+
+    data_a.observe(fail)
+    data_b.observe(received.append)
+
+    with pytest.raises(RuntimeError):
+        with LiveData.batch(data_a, data_b):
+            data_a.value = 1
+            data_b.value = 1
+
+    data_b.value = 2
+    assert received == [2]
+
+
+def test_nested_batch():
+    """
+    Nested batches notify when the outermost batch ends.
+    """
+    received: list[int] = []
+    data = LiveData[int](0)
+    data.observe(received.append)
+
+    with LiveData.batch(data):
+        with LiveData.batch(data):
+            data.value = 1
+        assert received == []
+
+    assert received == [1]
+
+    # The live data behaves normally after the batch
+    data.value = 2
+    assert received == [1, 2]
+
+
+def test_batch_bus_mode():
+    """
+    In bus mode, values set in a batch are notified immediately, no
+    event is dropped.
+    """
+    received: list[int] = []
+    bus = LiveData[int](0, bus_mode=True)
+    bus.observe(received.append)
+
+    with LiveData.batch(bus):
+        bus.value = 0
+        bus.value = 0
+        assert received == [0, 0]
+    assert received == [0, 0]
+
+
+def test_remove_observers():
+    """
+    Removed observers are not notified anymore.
+    """
+    received_a: list[int] = []
+    received_b: list[int] = []
+    data = LiveData[int](0)
+    data.observe(received_a.append)
+    data.observe(received_b.append)
+
+    data.remove(received_a.append)
+    data.value = 1
+    assert received_a == []
+    assert received_b == [1]
+
+    data.remove_all()
+    data.value = 2
+    assert received_b == [1]
+
+
+def test_observe_predicate():
+    """
+    An observer registered with a predicate is only called for the
+    accepted values.
+    """
+    received: list[int] = []
+    data = LiveData[int](1)
+    data.observe(received.append, init_call=True, predicate=lambda v: v % 2 == 0)
+    assert received == []
+
+    for value in range(2, 6):
+        data.value = value
+    assert received == [2, 4]
+
+
+def test_remove_while_notifying():
+    """
+    An observer can remove itself while being notified, the other
+    observers still receive the current value.
+    """
+    received: list[int] = []
+    data = LiveData[int](0)
+
+    def once(value: int):
+        received.append(value)
+        data.remove(once)
+
+    data.observe(once)
+    data.observe(received.append)
+
+    data.value = 1
+    data.value = 2
+    assert received == [1, 1, 2]
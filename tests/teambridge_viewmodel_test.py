@@ -149,3 +149,31 @@ def test_error(viewmodel_scanner: tuple[TeamBridgeViewModel, BarcodeScannerMock]
     wait_state(viewmodel, "WaitClockActionState")
     # The next action has been reset to clock action
     assert viewmodel.next_action == ViewModelAction.CLOCK_ACTION
+
+
+def test_texts_notified_on_change(
+    viewmodel_scanner: tuple[TeamBridgeViewModel, BarcodeScannerMock],
+):
+    """
+    Switch between the waiting states and check that the view is only
+    notified of the texts that actually changed.
+    """
+    viewmodel, scanner_mock = viewmodel_scanner
+
+    # Move to scanning state
+    scanner_mock.set_scanning(True)
+    wait_state(viewmodel, "WaitClockActionState")
+
+    titles: list[str] = []
+    subtitles: list[str] = []
+    viewmodel.main_title_text.observe(titles.append)
+    viewmodel.main_subtitle_text.observe(subtitles.append)
+
+    # The title is cleared on exit and set again on entry
+    viewmodel.next_action = ViewModelAction.CONSULTATION
+    wait_state(viewmodel, "WaitConsultationActionState")
+    viewmodel.next_action = ViewModelAction.CLOCK_ACTION
+    wait_state(viewmodel, "WaitClockActionState")
+
+    assert titles == []
+    assert subtitles == ["Mode de consultation", "Mode de timbrage"]
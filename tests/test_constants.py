@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+import os
 from pathlib import Path
 
 # Test employee identifiers
@@ -19,8 +20,14 @@ TEST_WRONG_VERSION_YEAR = 2025
 
 # Tests assets source folder
 TEST_ASSETS_SRC_FOLDER = "tests/assets/"
-# Tests assets destination folder
-TEST_ASSETS_DST_FOLDER = ".test-cache/assets/"
+# pytest-xdist worker running the tests ("gw0", "gw1", ...), if any
+TEST_WORKER_ID = os.environ.get("PYTEST_XDIST_WORKER", "")
+# Tests assets destination folder, one by worker
+TEST_ASSETS_DST_FOLDER = (
+    f".test-cache/assets-{TEST_WORKER_ID}/"
+    if TEST_WORKER_ID
+    else ".test-cache/assets/"
+)
 
 # Test sheets repository folder
 TEST_REPOSITORY_ROOT = str(Path(TEST_ASSETS_DST_FOLDER) / "repository")
@@ -830,6 +830,22 @@ def test_set_attendance_error(factory: TimeTrackerFactory, tc_month_closing: Cas
         assert year_error == CUSTOM_SOFT_ERROR
 
 
+def test_set_attendance_errors(
+    factory: TimeTrackerFactory, tc_month_closing: CaseData
+):
+    """
+    Write software errors on several dates at once and read them back.
+    """
+    date = tc_month_closing.datetime.date()
+    next_date = date + dt.timedelta(days=1)
+
+    with factory.create(TEST_EMPLOYEE_ID, tc_month_closing.datetime) as tracker:
+
+        tracker.set_attendance_errors({date: 10, next_date: 20})
+        assert tracker.get_attendance_error(date) == 10
+        assert tracker.get_attendance_error(next_date) == 20
+
+
 def test_register_max_evts(factory: TimeTrackerFactory, tc_vacation: CaseData):
     """
     Register the maximal number of events for an empty date and check